@@ -17,6 +17,9 @@ from .response_formatter import ResponseFormatter
 # API version numbers
 VERSION_1702 = 1702
 
+# HTTP methods that never modify data; their database sessions are not committed
+READ_ONLY_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS'))
+
 # Create Flask app and set up basic logging
 app = Flask(__name__)
 app.logger.setLevel(logging.INFO)
@@ -36,10 +39,22 @@ def before_request():
 
 
 def after_request(response):
-    dao.Session.close(commit=True)
+    """Commit changes made by successful write requests; discard anything else."""
+    commit = request.method not in READ_ONLY_METHODS and response.status_code < status.HTTP_400_BAD_REQUEST
+    dao.Session.close(commit=commit)
     return response
 
 
+def teardown_request(exception):
+    """Always release the request's session, even if after_request did not run."""
+    dao.Session.remove()
+
+
+app.before_request(before_request)
+app.after_request(after_request)
+app.teardown_request(teardown_request)
+
+
 def uri_path_prefix(*versions):
     """Construct a URI path prefix for the bookmarks API, given a list of supported versions"""
     if len(versions) < 1:
@@ -77,7 +77,11 @@ class Handlers(object):
             except ValueError:
                 raise BadRequest('count must be a valid int. was: {0}'.format(request.args['count']))
 
-        bookmarks, next_cursor = dao.Bookmark.select_bookmarks(topics=topics, cursor=start_cursor, max_results=max_results)
+        try:
+            bookmarks, next_cursor = dao.Bookmark.select_bookmarks(topics=topics, cursor=start_cursor,
+                                                                   max_results=max_results)
+        except ValueError as ve:
+            raise BadRequest(str(ve))
         if len(bookmarks) == 0:
             return '', status.HTTP_204_NO_CONTENT
 
@@ -139,7 +143,7 @@ class Handlers(object):
             try:
                 # first, try updating existing bookmark
                 bookmark = dao.Bookmark.update_bookmark(bookmark_id, **bookmark_json)
-            except dao.exc.RecordNotFoundError:
+            except dao.RecordNotFoundError:
                 # bookmark doesn't exist, so create it
                 bookmark_json['bookmark_id'] = bookmark_id
                 bookmark = dao.Bookmark.create_bookmark(**bookmark_json)
@@ -156,7 +160,7 @@ class Handlers(object):
         :param bookmark_id: ID of the bookmark to delete
         :param version: API version of the request
         :return: the response and HTTP status code
-        :raise: BadRequest when the bookmark_id is missing (which should never happen as it's required in the URL)
+        :raise: BadRequest when the bookmark_id is not a UUID
         :raise: InternalServerError when there is a server bug
         """
         try:
@@ -172,11 +176,14 @@ class Handlers(object):
         :param bookmark_id: ID of the bookmark to get
         :param version: API version of the request
         :return: the response and HTTP status code
-        :raise: BadRequest when the request is malformed or has invalid contents
+        :raise: BadRequest when the bookmark_id is not a UUID
         :raise: InternalServerError when there is a server bug
         :raise: NotFound if no bookmark found matching the bookmark_id
         """
-        bookmark = dao.Bookmark.select_bookmark_by_id(bookmark_id)
+        try:
+            bookmark = dao.Bookmark.select_bookmark_by_id(bookmark_id)
+        except ValueError as ve:
+            raise BadRequest(str(ve))
         if not bookmark:
             raise NotFound
 
@@ -135,6 +135,15 @@ class BookmarkManagerApiTests(unittest.TestCase):
         # Verify mocks
         mock_select_bookmarks.assert_called_once_with(cursor=None, max_results=None, topics=None)
 
+    def test_get_bookmarks__invalid_cursor_bookmark_id(self):
+        """Verify 400 if cursor contains a bookmark id that is not a UUID.
+        """
+        # base64 encoding of '2017-02-08T07:45:00|not-a-uuid'
+        response = self.get_bookmarks(topics=['topic_1'], cursor='MjAxNy0wMi0wOFQwNzo0NTowMHxub3QtYS11dWlk')
+
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+        self.assertIn("bookmark_id 'not-a-uuid' is not a UUID", self.get_response_str(response))
+
     def test_get_bookmarks__unavailable_version(self):
         """Verify 404 if invalid version is supplied.
         """
@@ -241,11 +250,32 @@ class BookmarkManagerApiTests(unittest.TestCase):
 
     def test_delete_bookmark_nonexistent(self):
         """Check that nonexistent bookmark delete returns 204"""
-        response = self.delete_bookmark('some-made-up-id')
+        response = self.delete_bookmark(uuid.uuid4())
 
         self.assertEqual(status.HTTP_204_NO_CONTENT, response.status_code)
         self.assertEqual('', self.get_response_str(response))
 
+    def test_delete_bookmark__invalid_id(self):
+        """Check that bookmark delete with an ID that is not a UUID returns 400"""
+        response = self.delete_bookmark('some-made-up-id')
+
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+        self.assertEqual("400 Bad Request: Invalid bookmark id 'some-made-up-id'", self.get_response_str(response))
+
+    def test_get_bookmark_by_id__invalid_id(self):
+        """Check that get bookmark with an ID that is not a UUID returns 400"""
+        response = self.get_bookmark_by_id('some-made-up-id')
+
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+        self.assertEqual("400 Bad Request: Invalid bookmark id 'some-made-up-id'", self.get_response_str(response))
+
+    def test_put_bookmark__invalid_id(self):
+        """Check that put bookmark with an ID that is not a UUID returns 400"""
+        response = self.put_bookmark('some-made-up-id', self.make_bookmark())
+
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+        self.assertEqual("400 Bad Request: Invalid bookmark id 'some-made-up-id'", self.get_response_str(response))
+
     def test_delete_bookmark_no_id(self):
         """Check that bookmark delete with no ID returns 405"""
         response = self.app.delete('/api/{0}/bookmarks/'.format(bookmarks.api.VERSION_1702))
@@ -261,7 +291,7 @@ class BookmarkManagerApiTests(unittest.TestCase):
         bookmark_id = uuid.uuid4()
         mock_formatted_bookmark = self.make_bookmark_response(bookmark_id)
 
-        mock_update_bookmark.side_effect = bookmarks.dao.exc.RecordNotFoundError('no such bookmark')
+        mock_update_bookmark.side_effect = bookmarks.dao.RecordNotFoundError('no such bookmark')
         mock_create_bookmark.return_value = {}
         mock_format_bookmark.return_value = mock_formatted_bookmark
 
@@ -269,3 +299,56 @@ class BookmarkManagerApiTests(unittest.TestCase):
 
         self.assertEqual(status.HTTP_200_OK, response.status_code)
         self.assertEqual(mock_formatted_bookmark, self.get_response_json(response))
+
+    @patch.object(bookmarks.api.ResponseFormatter, 'format_bookmark')
+    @patch.object(bookmarks.dao.Bookmark, 'create_bookmark')
+    @patch.object(bookmarks.dao, 'Session')
+    def test_session__successful_write_committed(self, mock_session, mock_create_bookmark, mock_format_bookmark):
+        """Check that the database session of a successful write request is committed and then removed"""
+        mock_format_bookmark.return_value = self.make_bookmark_response(uuid.uuid4())
+
+        response = self.post_bookmark(self.make_bookmark())
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        mock_session.get.assert_called_once_with()
+        mock_session.close.assert_called_once_with(commit=True)
+        mock_session.remove.assert_called_once_with()
+
+    @patch.object(bookmarks.api.ResponseFormatter, 'format_bookmark')
+    @patch.object(bookmarks.dao.Bookmark, 'select_bookmark_by_id')
+    @patch.object(bookmarks.dao, 'Session')
+    def test_session__read_not_committed(self, mock_session, mock_select_bookmark, mock_format_bookmark):
+        """Check that the database session of a read request is not committed, and is removed"""
+        bookmark_id = uuid.uuid4()
+        mock_format_bookmark.return_value = self.make_bookmark_response(bookmark_id)
+
+        response = self.get_bookmark_by_id(bookmark_id)
+
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        mock_session.close.assert_called_once_with(commit=False)
+        mock_session.remove.assert_called_once_with()
+
+    @patch.object(bookmarks.dao.Bookmark, 'create_bookmark')
+    @patch.object(bookmarks.dao, 'Session')
+    def test_session__client_error_write_not_committed(self, mock_session, mock_create_bookmark):
+        """Check that the database session of a write request that fails with 4xx is not committed, and is removed"""
+        mock_create_bookmark.side_effect = ValueError('bad bookmark')
+
+        response = self.post_bookmark(self.make_bookmark())
+
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+        mock_session.close.assert_called_once_with(commit=False)
+        mock_session.remove.assert_called_once_with()
+
+    @patch.object(bookmarks.api.ResponseFormatter, 'format_bookmark')
+    @patch.object(bookmarks.dao.Bookmark, 'create_bookmark')
+    @patch.object(bookmarks.dao, 'Session')
+    def test_session__server_error_write_not_committed(self, mock_session, mock_create_bookmark, mock_format_bookmark):
+        """Check that the database session of a write request that fails with 5xx is not committed, and is removed"""
+        mock_format_bookmark.side_effect = ValueError('cannot format bookmark')
+
+        response = self.post_bookmark(self.make_bookmark())
+
+        self.assertEqual(status.HTTP_500_INTERNAL_SERVER_ERROR, response.status_code)
+        mock_session.close.assert_called_once_with(commit=False)
+        mock_session.remove.assert_called_once_with()
@@ -1,7 +1,39 @@
-"""Expose externally-useful classes and instances at module level."""
+"""Expose externally-useful classes and instances at module level.
 
-from .session import Session
-from .bookmark_dao import Bookmark, BookmarkTopic
-from .bookmark_status import BookmarkStatus
-from .test_dao_factory import TestDaoFactory
-from .exc import RecordNotFoundError, DuplicateRecordError, InvalidOperationError, DaoError
+Attributes are imported on first access, so that importing a lightweight submodule such as
+bookmark_status does not pull in SQLAlchemy and the database settings.
+"""
+
+import importlib
+
+# Exported name -> submodule that defines it
+_EXPORTS = {
+    'Session': '.session',
+    'session_scope': '.session',
+    'Bookmark': '.bookmark_dao',
+    'BookmarkTopic': '.bookmark_dao',
+    'BookmarkStatus': '.bookmark_status',
+    'TestDaoFactory': '.test_dao_factory',
+    'RecordNotFoundError': '.exc',
+    'DuplicateRecordError': '.exc',
+    'InvalidOperationError': '.exc',
+    'DaoError': '.exc',
+}
+
+__all__ = tuple(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+
+    # Submodules, e.g. dao.exc, are also available as attributes
+    module_name = '{0}.{1}'.format(__name__, name)
+    try:
+        return importlib.import_module(module_name)
+    except ModuleNotFoundError as e:
+        if e.name != module_name:
+            raise
+    raise AttributeError("module '{0}' has no attribute '{1}'".format(__name__, name))
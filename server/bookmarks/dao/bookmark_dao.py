@@ -56,7 +56,22 @@ class Bookmark(Base):
         return '{0}|{1}'.format(sort_date.replace(tzinfo=None, microsecond=0).isoformat(), bookmark_id)
     
     @classmethod
-    def _parse_cursor(cls, cursor: str) -> Tuple[datetime, str]:
+    def _parse_bookmark_id(cls, bookmark_id: Union[str, uuid.UUID]) -> uuid.UUID:
+        """Convert bookmark id provided by caller to UUID.
+
+        :param bookmark_id: UUID or string that is bookmark id
+        :return: bookmark id as UUID
+        :raise: ValueError if bookmark_id is not a UUID
+        """
+        if isinstance(bookmark_id, uuid.UUID):
+            return bookmark_id
+        try:
+            return uuid.UUID(str(bookmark_id))
+        except ValueError:
+            raise ValueError("Invalid bookmark id '{0}'".format(bookmark_id))
+
+    @classmethod
+    def _parse_cursor(cls, cursor: str) -> Tuple[datetime, uuid.UUID]:
         """Parse components out of cursor string provided to select_bookmarks.
 
         :param cursor: string generated by _format_cursor
@@ -71,7 +86,11 @@ class Bookmark(Base):
         except ValueError:
             raise ValueError("Invalid cursor format; sort_date '{0}' not in expected format %Y-%m-%dT%H:%M:%S".format(
                     toks[0]))
-        return sort_date, toks[1]
+        try:
+            bookmark_id = cls._parse_bookmark_id(toks[1])
+        except ValueError:
+            raise ValueError("Invalid cursor format; bookmark_id '{0}' is not a UUID".format(toks[1]))
+        return sort_date, bookmark_id
 
     @classmethod
     def create_bookmark(cls, **kwargs) -> 'Bookmark':
@@ -94,6 +113,7 @@ class Bookmark(Base):
         :raise: ValueError if required args are not specified
         :raise: ValueError if display_date is not in expected format
         :raise: ValueError if status is specified and something other than 'new' or 'submitted'
+        :raise: ValueError if bookmark_id is specified and not a UUID
         :raise: ValueError if extra args are specified
 
         """
@@ -107,7 +127,11 @@ class Bookmark(Base):
         except DateParseError as parse_error:
             raise ValueError(str(parse_error))
 
-        attrs = {'bookmark_id': kwargs.pop('bookmark_id', uuid.uuid4()),
+        if 'bookmark_id' in kwargs:
+            bookmark_id = cls._parse_bookmark_id(kwargs.pop('bookmark_id'))
+        else:
+            bookmark_id = UUIDType.random_uuid()
+        attrs = {'bookmark_id': bookmark_id,
                  'url': kwargs.pop('url'),
                  'summary': kwargs.pop('summary'),
                  'sort_date': sort_date,
@@ -144,9 +168,11 @@ class Bookmark(Base):
         the bookmark not existing is True if it isn't there in the first place.
 
         :param bookmark_id: UUID or string that is id of bookmark to be deleted
+        :raise: ValueError if bookmark_id is missing or not a UUID
         """
         if not bookmark_id:
             raise ValueError("Missing required argument 'bookmark_id'")
+        bookmark_id = cls._parse_bookmark_id(bookmark_id)
         Session.get().query(Bookmark).filter_by(bookmark_id=bookmark_id).delete()
         
 
@@ -188,7 +214,9 @@ class Bookmark(Base):
 
         :param bookmark_id: UUID or string that is bookmark id
         :return: selected Bookmark or None if no such bookmark exists
+        :raise: ValueError if bookmark_id is not a UUID
         """
+        bookmark_id = cls._parse_bookmark_id(bookmark_id)
         query = Session.get().query(Bookmark).filter_by(bookmark_id=bookmark_id)
         return query.first()
 
@@ -208,6 +236,7 @@ class Bookmark(Base):
         :param **kwargs: dict of optional data described above
 
         :return: updated Bookmark
+        :raise: ValueError if bookmark_id is not a UUID
         :raise: RecordNotFoundError if no such bookmark exists
         :raise: ValueError if required bookmark data is being set to empty value or None
         :raise: ValueError if display_date is specified and not in expected format
@@ -215,7 +244,7 @@ class Bookmark(Base):
         :raise: ValueError if extra args are specified
 
         """
-        bookmark = cls.select_bookmark_by_id(bookmark_id)
+        bookmark = cls.select_bookmark_by_id(cls._parse_bookmark_id(bookmark_id))
         if not bookmark:
             raise RecordNotFoundError("No bookmark by id {0}".format(bookmark_id))
 
@@ -271,11 +300,18 @@ class Bookmark(Base):
 
         If topic from provided list is not currently associated with bookmark, add a new BookmarkTopic for it.
         If topic currently associated with bookmark is not in provided list, delete the existing BookmarkTopic.
+        As an exception, clearing the topics of a persisted Bookmark deletes them from db immediately.
         
         :param topic_names: List of strings that are topics associated with bookmark
         """
         if not topic_names:
-            self.topics = []
+            state = sa.inspect(self)
+            if state.persistent and not state.attrs.topics.history.has_changes():
+                # Delete all topics with one statement rather than loading them and deleting each orphan
+                state.session.query(BookmarkTopic).filter_by(bookmark_id=self.bookmark_id).delete()
+                sa_orm.attributes.set_committed_value(self, 'topics', [])
+            else:
+                self.topics = []
         else:
             current_topic_names = set(self.topic_names)
             updated_topic_names = set(topic_names)
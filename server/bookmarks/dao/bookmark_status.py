@@ -18,29 +18,43 @@ class BookmarkStatus(object):
     VALID_ORIGINAL_STATUSES = (NEW, SUBMITTED)
     VALID_STATUSES = (NEW, SUBMITTED, ACCEPTED, REJECTED)
 
+    # Sets for membership tests; tuples above preserve order for error messages
+    _VALID_ORIGINAL_STATUSES_SET = frozenset(VALID_ORIGINAL_STATUSES)
+    _VALID_STATUSES_SET = frozenset(VALID_STATUSES)
+
+    # Statuses to which a bookmark in a given status may transition.
+    # Status can never transition to NEW. All other transitions are valid, at least for now.
+    _ALLOWED_TRANSITIONS = {
+        NEW: _VALID_STATUSES_SET,
+        SUBMITTED: _VALID_STATUSES_SET.difference((NEW,)),
+        ACCEPTED: _VALID_STATUSES_SET.difference((NEW,)),
+        REJECTED: _VALID_STATUSES_SET.difference((NEW,)),
+    }
+
+    # Static portions of validation error messages
+    _VALID_ORIGINAL_STATUSES_MSG = ' or '.join("'{}'".format(s) for s in VALID_ORIGINAL_STATUSES)
+    _VALID_STATUSES_MSG = ', '.join("'{}'".format(s) for s in VALID_STATUSES)
+
     @classmethod
     def assert_valid_status(cls, status: str):
         """Raise if provided status string is not valid."""
-        if status not in cls.VALID_STATUSES:
+        if status not in cls._VALID_STATUSES_SET:
             raise ValueError("Invalid bookmark status '{0}'; must be one of {1}".format(
-                    status, ', '.join(["'{}'".format(s) for s in cls.VALID_STATUSES])))
+                    status, cls._VALID_STATUSES_MSG))
 
     @classmethod
     def assert_valid_original_status(cls, status: str):
         """Raise if provided status string may not be set on a newly created bookmark."""
-        if status not in cls.VALID_ORIGINAL_STATUSES:
+        if status not in cls._VALID_ORIGINAL_STATUSES_SET:
             raise ValueError("Invalid bookmark status for new bookmark '{0}'; must be {1}".format(
-                    status, ' or '.join(["'{}'".format(s) for s in cls.VALID_ORIGINAL_STATUSES])))
+                    status, cls._VALID_ORIGINAL_STATUSES_MSG))
 
     @classmethod
     def assert_valid_status_transition(cls, old_status: str, new_status: str):
         """Raise if either status is invalid or if transition from old_status to new_status is not allowed.
         """
-        for status in (old_status, new_status):
-            cls.assert_valid_status(status)
-
-        # Status can never transition to NEW.
-        # All other transitions are valid, at least for now.
-        if not (old_status == cls.NEW or new_status != cls.NEW):
+        cls.assert_valid_status(old_status)
+        cls.assert_valid_status(new_status)
+        if new_status not in cls._ALLOWED_TRANSITIONS[old_status]:
             raise ValueError("Invalid bookmark status transition '{0}' -> '{1}'".format(old_status, new_status))
 
@@ -2,33 +2,55 @@
  by specifying a display date.
 """
 import datetime
+import re
 
 from typing import Tuple
 
 
 class DateParser(object):
 
-    _formats = [
-        "%Y.%m.%d %H:%M",
-        "%Y.%m.%d %H",
-        "%Y.%m.%d",
-        "%Y.%m",
+    # Display date format, indexed by number of date components present
+    _formats = (
+        None,
         "%Y",
-    ]
+        "%Y.%m",
+        "%Y.%m.%d",
+        "%Y.%m.%d %H",
+        "%Y.%m.%d %H:%M",
+    )
+
+    # Year, then optionally month, day, hour and minute, each only if the previous one is present; accepts
+    # what strptime accepts for the formats above
+    _display_date_re = re.compile(r"""
+        (\d{4})                       # year
+        (?:\.(\d{1,2})                # month
+          (?:\.(\d{1,2}|\ [1-9])      # day; strptime also accepts a single digit padded with a space
+            (?:\s+(\d{1,2})           # hour, after any whitespace
+              (?::(\d{1,2}))?         # minute
+            )?
+          )?
+        )?
+        """, re.ASCII | re.VERBOSE)
 
     @classmethod
     def parse_date(cls, display_date: str) -> Tuple[datetime.datetime, str]:
         """
         Parses a display date and returns that date in ISO format and its inferred display format.
 
+        The format is inferred from a single regular expression match rather than by attempting each format in turn.
+
         :param display_date: a date in display format. Valid formats are: YYYY, YYYY.mm, YYYY.mm.dd, YYYY.mm.dd HH,
         YYYY.mm.dd HH:MM
         :return: the parsed date as a datetime, and the inferred display format
+        :raise: DateParseError if display_date is in none of the valid formats, or is not a valid date
         """
-        for date_format in cls._formats:
+        match = cls._display_date_re.fullmatch(display_date)
+        if match:
+            components = [int(c) for c in match.groups() if c is not None]
+            # Month and day default to 1
+            components += [1] * (3 - len(components))
             try:
-                date = datetime.datetime.strptime(display_date, date_format)
-                return date, date_format
+                return datetime.datetime(*components), cls._formats[match.lastindex]
             except ValueError:
                 pass
 
@@ -42,4 +64,3 @@ class DateParseError(Exception):
     def __init__(self, parse_str):
         msg = 'can\'t parse date from: "{0}"'.format(parse_str)
         super(DateParseError, self).__init__(msg)
-
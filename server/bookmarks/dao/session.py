@@ -1,25 +1,93 @@
 """Database session management."""
 
+import asyncio
+import atexit
+from contextlib import contextmanager
 import logging
+import os
 from subprocess import check_call
+import threading
 
+import psycopg2
 import sqlalchemy as sa
 import sqlalchemy.orm as sa_orm
 
-from .settings import PRESTERITY_DB_URL, PRESTERITY_ENV
+from .settings import (PRESTERITY_DB_EXECUTEMANY_BATCH_PAGE_SIZE, PRESTERITY_DB_INSERTMANYVALUES_PAGE_SIZE,
+                       PRESTERITY_DB_POOL_RECYCLE, PRESTERITY_ENV, get_db_url)
 
 __all__ = ('Session',
-           'init_local_db')
+           'init_local_db',
+           'session_scope')
 
 log = logging.getLogger(__name__)
 
+# Local database objects created by init_local_db; see README
+_LOCAL_DB_NAME = 'presterity'
+_LOCAL_DB_SCHEMA = 'apps'
+_LOCAL_DB_USER = 'app_user'
+_LOCAL_DB_PASSWORD = 'resist'
+
+# Directory containing migration.py and the sql/ migrations it refers to
+_SERVER_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _resolve_scopefunc():
+    """Return function identifying the current unit of concurrency for scoped sessions.
+
+    Inside a running asyncio event loop, sessions are scoped to the current task, since many tasks
+    share one thread. Otherwise, under a greenlet-based server (gevent, eventlet) sessions are
+    scoped to the current greenlet when greenlet is available, falling back to the current thread.
+
+    The scoped session registry holds a strong reference to each task it is keyed by, so a task that
+    used Session must call Session.remove before finishing; otherwise the finished task and its
+    session are kept alive for the life of the process.
+    """
+    try:
+        from greenlet import getcurrent as get_ident
+    except ImportError:
+        get_ident = threading.get_ident
+
+    def scopefunc():
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            # No running event loop
+            return get_ident()
+        return task if task is not None else get_ident()
+
+    return scopefunc
+
+
+def _create_engine(db_url, **kwargs):
+    """Create engine for specified database URL; kwargs are create_engine options overriding the defaults below.
+
+    Multi-row executes are batched: INSERTs are rendered as multi-row VALUES statements, and with
+    psycopg2, UPDATEs and DELETEs are sent in pages rather than one round-trip per row.
+
+    Pooled connections are checked on checkout and recycled periodically, so a connection dropped
+    by the server while idle is replaced rather than surfacing as an OperationalError.
+    """
+    options = {'insertmanyvalues_page_size': PRESTERITY_DB_INSERTMANYVALUES_PAGE_SIZE,
+               'pool_pre_ping': True,
+               'pool_recycle': PRESTERITY_DB_POOL_RECYCLE}
+    if db_url.get_backend_name() == 'postgresql':
+        options['client_encoding'] = 'utf8'
+    if db_url.get_driver_name() == 'psycopg2':
+        options['executemany_mode'] = 'values_plus_batch'
+        options['executemany_batch_page_size'] = PRESTERITY_DB_EXECUTEMANY_BATCH_PAGE_SIZE
+    options.update(kwargs)
+    return sa.create_engine(db_url, **options)
+
 
 class Session(object):
     """Utility class for managing SQLAlchemy session."""
 
     # Scoped session registry; to be 
     _session = None
-    
+
+    # Guards initialization so that concurrent first requests create only one engine
+    _init_lock = threading.Lock()
+
     @classmethod
     def initialize(cls):
         """Create scoped session.
@@ -28,19 +96,27 @@ class Session(object):
         It will be called automatically by Session.get if necessary, but rather than delay the first
         get, it is preferable to call this when the process starts.
         """
-        if cls._session:
-            log.info("Session has already been initialized")
-        else:
-            log.info("Connecting to db %s", PRESTERITY_DB_URL)
-            engine = sa.create_engine(PRESTERITY_DB_URL, client_encoding='utf8')
-            cls._session = sa_orm.scoped_session(sa_orm.sessionmaker(bind=engine))
+        with cls._init_lock:
+            if cls._session:
+                log.info("Session has already been initialized")
+            else:
+                db_url = get_db_url()
+                log.info("Connecting to db %s", db_url)
+                engine = _create_engine(db_url)
+                cls._session = sa_orm.scoped_session(sa_orm.sessionmaker(bind=engine),
+                                                     scopefunc=_resolve_scopefunc())
 
     @classmethod
     def get(cls):
-        """Return scoped session, creating it if necessary."""
-        if cls._session is None:
+        """Return scoped session, creating it if necessary.
+
+        Once the session exists, no lock is taken; only initialize serializes on _init_lock.
+        """
+        session = cls._session
+        if session is None:
             cls.initialize()
-        return cls._session
+            session = cls._session
+        return session
 
     @classmethod
     def close(cls, commit=True):
@@ -49,5 +125,82 @@ class Session(object):
         if cls._session is not None:
             if commit:
                 cls._session.commit()
+            cls.remove()
+
+    @classmethod
+    def remove(cls):
+        """Discard current scoped session without committing, returning its connection to the pool.
+
+        Safe to call whether or not a session is in use; intended for request teardown.
+        """
+        if cls._session is not None:
             cls._session.remove()
 
+
+# At exit, return the main thread's connection to the pool; registered here, once, as initialize may run again
+atexit.register(Session.remove)
+
+
+@contextmanager
+def session_scope(read_only=False):
+    """Provide scoped session for the duration of a unit of work.
+
+    On success, commit unless read_only; if the block raises, roll back. Either way, remove the
+    session afterwards, returning its connection to the pool.
+    """
+    session = Session.get()
+    try:
+        yield session
+        if not read_only:
+            session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        Session.remove()
+
+
+@contextmanager
+def _local_db_cursor(dbname='postgres'):
+    """Yield autocommit cursor on local database dbname, connected as the current OS user."""
+    conn = psycopg2.connect(dbname=dbname)
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cursor:
+            yield cursor
+    finally:
+        conn.close()
+
+
+def init_local_db():
+    """Create local presterity database, apps schema and app_user role, then apply migrations.
+
+    Performs the database setup steps described in the README. Requires a Postgres superuser role
+    for the current OS user. Objects that already exist are left alone, and once initialization
+    has succeeded, subsequent calls in the same process do nothing.
+    """
+    if getattr(init_local_db, 'already_init', False):
+        return
+    if PRESTERITY_ENV != 'local':
+        raise ValueError("init_local_db requires PRESTERITY_ENV 'local', not '{0}'".format(PRESTERITY_ENV))
+
+    log.info("Initializing local database %s", _LOCAL_DB_NAME)
+    # Database and role are cluster-wide, so are created from the maintenance database
+    with _local_db_cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_database WHERE datname = %s", (_LOCAL_DB_NAME,))
+        if cursor.fetchone() is None:
+            cursor.execute("CREATE DATABASE {0}".format(_LOCAL_DB_NAME))
+        cursor.execute("SELECT 1 FROM pg_roles WHERE rolname = %s", (_LOCAL_DB_USER,))
+        if cursor.fetchone() is None:
+            cursor.execute("CREATE USER {0} WITH PASSWORD %s".format(_LOCAL_DB_USER), (_LOCAL_DB_PASSWORD,))
+            cursor.execute("ALTER ROLE {0} SET search_path TO {1}".format(_LOCAL_DB_USER, _LOCAL_DB_SCHEMA))
+
+    with _local_db_cursor(_LOCAL_DB_NAME) as cursor:
+        cursor.execute("CREATE SCHEMA IF NOT EXISTS {0}".format(_LOCAL_DB_SCHEMA))
+        cursor.execute("GRANT ALL ON SCHEMA {0} TO {1}".format(_LOCAL_DB_SCHEMA, _LOCAL_DB_USER))
+
+    # Apply schema migrations; both commands are no-ops if already applied
+    env = dict(os.environ, MSCHEMATOOL_CONFIG=os.path.join(_SERVER_DIR, 'migration.py'))
+    check_call('mschematool local init_db && mschematool local sync', shell=True, cwd=_SERVER_DIR, env=env)
+
+    init_local_db.already_init = True
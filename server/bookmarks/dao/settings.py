@@ -1,39 +1,61 @@
 """Settings for the presterity DAO layer."""
 
+import functools
 import logging
 import os
 
 log = logging.getLogger(__name__)
 
 
+def _postgres_url(password: str, host: str):
+    """Return sqlalchemy URL for the presterity database on the specified host.
+
+    The URL is a structured object rather than a connection string so that passwords containing
+    URL-special characters need no escaping and are masked when logged.
+    """
+    from sqlalchemy.engine import URL
+    return URL.create('postgresql+psycopg2',
+                      username='app_user',
+                      password=password,
+                      host=host,
+                      database='presterity')
+
+
+# Builders of database URL, keyed by environment. Adding an environment is a one-line
+# registration here; builders only run on first use, so passwords for environments other
+# than the current one need not be set.
+_DB_URL_BUILDERS = {
+    'local': lambda: _postgres_url('resist', 'localhost'),
+    'dev': lambda: _postgres_url(os.environ['PRESTERITY_DEV_PASSWORD'], 'somehost'),
+    'prod': lambda: _postgres_url(os.environ['PRESTERITY_PROD_PASSWORD'], 'somehost'),
+}
+
+
 # PRESTERITY_ENV: str.
 # A string representing the environment to use for PRESTERITY. Should be one of
 # 'local', 'dev', or 'prod'.
 PRESTERITY_ENV = os.environ.get('PRESTERITY_ENV', 'local')
-_PRESTERITY_ENVS = ['local', 'dev', 'prod']
-if PRESTERITY_ENV not in _PRESTERITY_ENVS:
-    log.warn("Unexpected value '{0}' for PRESTERITY_ENV; expected one of {1}".format(
-            PRESTERITY_ENV, ', '.join(_PRESTERITY_ENVS)))
-
-
-# URL string for the database
-PRESTERITY_DB_URL = None
-_POSTGRES_CONNECTION_STRING = 'postgresql://{user}:{password}@{netloc_and_port}/{database}'
-if PRESTERITY_ENV == 'local':
-    PRESTERITY_DB_URL = _POSTGRES_CONNECTION_STRING.format(
-        user='app_user',
-        password='resist',
-        netloc_and_port='localhost',
-        database='presterity')
-elif PRESTERITY_ENV == 'dev':
-    PRESTERITY_DB_URL = _POSTGRES_CONNECTION_STRING.format(
-        user='app_user',
-        password=os.environ['PRESTERITY_DEV_PASSWORD'],
-        netloc_and_port='somehost:someport',
-        database='presterity')
-elif PRESTERITY_ENV == 'prod':
-    PRESTERITY_DB_URL = _POSTGRES_CONNECTION_STRING.format(
-        user='app_user',
-        password=os.environ['PRESTERITY_PROD_PASSWORD'],
-        netloc_and_port='somehost:someport',
-        database='presterity')
+if PRESTERITY_ENV not in _DB_URL_BUILDERS:
+    log.warning("Unexpected value '{0}' for PRESTERITY_ENV; expected one of {1}".format(
+            PRESTERITY_ENV, ', '.join(_DB_URL_BUILDERS)))
+
+
+# Engine tuning for batched writes: rows rendered into each multi-row INSERT, and statements
+# per batch when executing many UPDATEs or DELETEs.
+PRESTERITY_DB_INSERTMANYVALUES_PAGE_SIZE = int(os.environ.get('PRESTERITY_DB_INSERTMANYVALUES_PAGE_SIZE', 1000))
+PRESTERITY_DB_EXECUTEMANY_BATCH_PAGE_SIZE = int(os.environ.get('PRESTERITY_DB_EXECUTEMANY_BATCH_PAGE_SIZE', 500))
+
+# Seconds after which pooled connections are replaced, so connections closed by Postgres or a
+# proxy for being idle are not handed out
+PRESTERITY_DB_POOL_RECYCLE = int(os.environ.get('PRESTERITY_DB_POOL_RECYCLE', 1800))
+
+
+@functools.lru_cache(maxsize=None)
+def get_db_url(env: str=PRESTERITY_ENV):
+    """Return sqlalchemy URL for the database of the specified environment; None if env is unknown.
+
+    Built on first use, so importing settings neither imports SQLAlchemy nor requires database
+    passwords to be set.
+    """
+    builder = _DB_URL_BUILDERS.get(env)
+    return builder() if builder else None
@@ -1,185 +1,324 @@
 """Tests for Bookmark DAO objects.
 
 python -m unittest -v bookmarks.dao.test_bookmark_dao
+
+To run without Postgres, against an in-memory SQLite database:
+
+PRESTERITY_TEST_DB_URL=sqlite:///:memory: python -m unittest -v bookmarks.dao.test_bookmark_dao
 """
 
-from datetime import datetime, timedelta
-import pytz
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+import os
 import unittest
 from unittest.mock import patch, Mock
 import uuid
 
-from .session import Session
+import sqlalchemy as sa
+import sqlalchemy.orm as sa_orm
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.pool import StaticPool
+import sqlalchemy.types as sa_types
+
+from .session import Session, _create_engine
 from .test_dao_factory import TestDaoFactory
-from .bookmark_dao import Bookmark, BookmarkTopic, BookmarkNote, BookmarkStatus
+from .bookmark_dao import Base, Bookmark, BookmarkTopic, BookmarkNote, BookmarkStatus
+from .date_parser import DateParser, DateParseError
+
+UTC = timezone.utc
+
+# Database to run these tests against instead of the configured one, e.g. sqlite:///:memory:
+_TEST_DB_URL = os.environ.get('PRESTERITY_TEST_DB_URL')
+
+
+class _SQLiteUTCDateTime(sqlite.DATETIME):
+    """SQLite DATETIME that stores timezone-aware datetimes in UTC and reads them back as UTC.
+
+    SQLite has no time zone storage; like TIMESTAMP WITH TIME ZONE on Postgres, this makes columns
+    with timezone=True round-trip aware datetimes rather than returning them naive.
+    """
+
+    def bind_processor(self, dialect):
+        process = super(_SQLiteUTCDateTime, self).bind_processor(dialect)
+
+        def bind(value):
+            if self.timezone and value is not None and value.tzinfo is not None:
+                value = value.astimezone(UTC)
+            return process(value)
+        return bind
+
+    def result_processor(self, dialect, coltype):
+        process = super(_SQLiteUTCDateTime, self).result_processor(dialect, coltype)
+
+        def result(value):
+            value = process(value)
+            if self.timezone and value is not None:
+                value = value.replace(tzinfo=UTC)
+            return value
+        return result
+
+
+# Connection shared by all database tests in this module; see _bind_session_to_shared_connection
+_engine = None
+_connection = None
+_outer_transaction = None
+
+
+def _create_test_engine(db_url):
+    """Create engine for alternate test database, with bookmark tables created.
+
+    The engine has the same batching options as the application's, and all checkouts share a single
+    connection, so an in-memory SQLite database persists for the module. That connection may be used
+    from threads other than the one that opened it, e.g. by code under test that starts threads.
+    """
+    db_url = sa.engine.make_url(db_url)
+    options = {'poolclass': StaticPool}
+    is_sqlite = db_url.get_backend_name() == 'sqlite'
+    if is_sqlite:
+        options['connect_args'] = {'check_same_thread': False}
+    engine = _create_engine(db_url, **options)
+    if is_sqlite:
+        # Timezone-aware columns round-trip aware datetimes, as on Postgres
+        engine.dialect.colspecs = dict(engine.dialect.colspecs)
+        for datetime_type in (sa_types.DateTime, sa_types.TIMESTAMP):
+            engine.dialect.colspecs[datetime_type] = _SQLiteUTCDateTime
+
+        @sa.event.listens_for(engine, 'connect')
+        def on_connect(dbapi_connection, connection_record):
+            # Disable pysqlite's own transaction handling so that SAVEPOINTs work
+            dbapi_connection.isolation_level = None
+            cursor = dbapi_connection.cursor()
+            for pragma in ('journal_mode=MEMORY', 'synchronous=OFF', 'foreign_keys=ON'):
+                cursor.execute('PRAGMA {0}'.format(pragma))
+            cursor.close()
+
+        @sa.event.listens_for(engine, 'begin')
+        def on_begin(connection):
+            connection.exec_driver_sql('BEGIN')
+
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def _bind_session_to_shared_connection():
+    """Bind the scoped session to a single connection, inside an outer transaction that is never committed.
+
+    The connection is opened by the first database test class to run, and closed in tearDownModule.
+    """
+    global _engine, _connection, _outer_transaction
+    if _connection is not None:
+        return
+    session = Session.get()
+    _engine = session.get_bind()
+    session.remove()
+    test_engine = _create_test_engine(_TEST_DB_URL) if _TEST_DB_URL else _engine
+    _connection = test_engine.connect()
+    _outer_transaction = _connection.begin()
+    # Session commits release a savepoint instead of committing the outer transaction, so there is
+    # no concurrent writer whose changes loaded objects would need to be expired to see
+    session.configure(bind=_connection, join_transaction_mode='create_savepoint', expire_on_commit=False)
+
+
+def tearDownModule():
+    """Discard everything written through the shared connection and restore the session's engine binding."""
+    global _connection, _outer_transaction
+    if _connection is None:
+        return
+    session = Session.get()
+    session.remove()
+    session.configure(bind=_engine, join_transaction_mode='conservative_savepoint', expire_on_commit=True)
+    _outer_transaction.rollback()
+    _connection.close()
+    _connection = _outer_transaction = None
 
 
 class BookmarkDaoTestCase(unittest.TestCase):
+    """Base class for tests that use the database.
+
+    Each test runs within a savepoint on the module's shared connection that is rolled back in
+    tearDown, so tests see an empty database and leave nothing behind.
+
+    Subclasses that set _SEED_TEST_BOOKMARK instead see one bookmark with _TEST_BOOKMARK_ATTRS and
+    id _bookmark_id, saved once in setUpClass within a savepoint for the class.
+    """
+
+    _url = "http://nytimes.com/news/article.html"
+    _summary = "Good article about peanuts"
+    _sort_date = datetime(2017, 2, 7, 18, 30, tzinfo=UTC)
+
+    # Id of bookmark saved by _create_test_bookmark. Tests are isolated by rollback, so a fixed id
+    # serves every test; tests needing an id that matches nothing still use uuid4.
+    _bookmark_id = uuid.UUID(int=100)
+
+    # Attributes of bookmark saved by _create_test_bookmark, apart from bookmark_id
+    _TEST_BOOKMARK_ATTRS = {'url': _url,
+                            'summary': _summary,
+                            'sort_date': _sort_date}
+
+    # Whether setUpClass saves a test bookmark shared by all tests in the class
+    _SEED_TEST_BOOKMARK = False
+
+    @classmethod
+    def setUpClass(cls):
+        _bind_session_to_shared_connection()
+        if cls._SEED_TEST_BOOKMARK:
+            cls._class_savepoint = _connection.begin_nested()
+            session = Session.get()
+            session.add(Bookmark(bookmark_id=cls._bookmark_id, **cls._TEST_BOOKMARK_ATTRS))
+            session.commit()
+            Session.remove()
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls._SEED_TEST_BOOKMARK:
+            cls._class_savepoint.rollback()
 
     def setUp(self):
+        self._savepoint = _connection.begin_nested()
         self.session = Session.get()
-        self._test_bookmark_ids = []
-
-        self._bookmark_id = uuid.uuid4()
-        self._url = "http://nytimes.com/news/article.html"
-        self._summary = "Good article about peanuts"
-        self._sort_date = datetime(2017, 2, 7, 18, 30, tzinfo=pytz.utc)
 
     def tearDown(self):
-        # Delete test bookmarks
-        for bookmark_id in self._test_bookmark_ids:
-            self.session.query(Bookmark).filter_by(bookmark_id=bookmark_id).delete()
-        Session.close()
-
-    def _create_test_bookmark(self, **kwargs):
-        """Return Bookmark that has been saved to db."""
-        attrs = {'bookmark_id': self._bookmark_id,
-                 'url': self._url,
-                 'summary': self._summary,
-                 'sort_date': self._sort_date}
-        attrs.update(**kwargs)
-        self._save_bookmark(Bookmark(**attrs))
-        return self._select_bookmark(self._bookmark_id)
+        # Discard session state, then everything the test wrote
+        Session.remove()
+        self._savepoint.rollback()
 
-    def _save_bookmark(self, bookmark):
-        """Helper function for saving bookmark to database; records id for cleanup"""
-        saved_bookmark = self.session.merge(bookmark)
-        self.session.flush()
-        self._test_bookmark_ids.append(saved_bookmark.bookmark_id)
-        return saved_bookmark
+    def _create_test_bookmark(self, topic_names=(), **kwargs):
+        """Return Bookmark that has been saved to db.
 
-    def _select_bookmarks(self):
-        """Select all bookmarks."""
-        return self.session.query(Bookmark).all()
+        The bookmark and its topics are each saved with a single bulk INSERT rather than through the
+        unit of work; kwargs are Bookmark attributes that override _TEST_BOOKMARK_ATTRS.
+        """
+        attrs = dict(self._TEST_BOOKMARK_ATTRS, bookmark_id=self._bookmark_id)
+        attrs.update(kwargs)
+        self.session.execute(sa.insert(Bookmark), [attrs])
+        if topic_names:
+            self.session.execute(sa.insert(BookmarkTopic),
+                                 [{'bookmark_id': attrs['bookmark_id'], 'topic': topic} for topic in topic_names])
+        return self._select_bookmark(attrs['bookmark_id'])
 
-    def _select_bookmark(self, bookmark_id):
-        """Retrieve specified bookmark from db; return None if it is not found."""
-        return self.session.query(Bookmark).filter_by(bookmark_id=bookmark_id).first()
-        
+    def _save_bookmark(self, bookmark):
+        """Helper function for saving new bookmark to database."""
+        self.session.add(bookmark)
+        self.session.flush()
+        return bookmark
 
-class BookmarkTests(BookmarkDaoTestCase):
-    """Verify Bookmark ORM."""
+    def _insert_bookmarks(self, bookmark_attrs):
+        """Insert bookmarks described by list of attribute dicts with a single bulk INSERT."""
+        self.session.execute(sa.insert(Bookmark), bookmark_attrs)
+        return bookmark_attrs
 
-    def setUp(self):
-        super(BookmarkTests, self).setUp()
-
-        self._description = "Peanuts do not grow on trees!"
-        self._display_date_format = '%Y.%m'
-        self._status = 'duplicate'
-        self._source = 'raindrop'
-        self._source_item_id = '1234-abc'
-        self._source_last_updated = datetime(2017, 2, 7, 23, 10, tzinfo=pytz.utc)
-        self._submitter_id = 'aladdin'
-        self._submitted_on = datetime.utcnow().replace(tzinfo=pytz.utc)
-
-    def test_bookmark__required(self):
-        """Verify Bookmark creation with only required data."""
-        bookmark = Bookmark(
-            url=self._url,
-            summary=self._summary,
-            sort_date=self._sort_date)
+    def _save_bookmarks(self, bookmarks):
+        """Save new bookmarks to database with a single flush."""
+        self.session.add_all(bookmarks)
+        self.session.flush()
+        return bookmarks
 
-        saved_bookmark = self._save_bookmark(bookmark)
+    @contextmanager
+    def _patch_parse_date(self, **kwargs):
+        """Patch DateParser.parse_date, used to parse display_date, with mock configured by kwargs."""
+        with patch.object(DateParser, 'parse_date', **kwargs) as mock_parse_date:
+            yield mock_parse_date
 
-        bookmarks = self._select_bookmarks()
-        self.assertEqual(1, len(bookmarks))
-        retrieved_bookmark = bookmarks[0]
+    def _select_bookmark(self, bookmark_id):
+        """Retrieve specified bookmark, with its topics and notes; return None if it is not found.
 
-        # Verify specified attributes
-        self.assertIsNotNone(retrieved_bookmark.bookmark_id)
-        self.assertTrue(isinstance(retrieved_bookmark.bookmark_id, uuid.UUID))
-        self.assertEqual(self._url, retrieved_bookmark.url)
-        self.assertEqual(self._summary, retrieved_bookmark.summary)
-        self.assertEqual(self._sort_date, retrieved_bookmark.sort_date)
+        Always queries db, so this verifies what was persisted: a bookmark already in the session's
+        identity map is refreshed from its row, and not returned at all if the row is gone.
+        """
+        return self.session.get(Bookmark, bookmark_id, populate_existing=True,
+                                options=[sa_orm.joinedload(Bookmark.topics), sa_orm.joinedload(Bookmark.notes)])
 
-        # Verify default attributes
-        self.assertEqual('new', retrieved_bookmark.status)
-        self.assertEqual('%Y.%m.%d', retrieved_bookmark.display_date_format)
+    def _exists(self, model, **kwargs):
+        """Return True if db has any row of model matching kwargs, without loading it."""
+        probe = sa.select(sa.literal(1)).select_from(model).filter_by(**kwargs).limit(1)
+        return self.session.execute(probe).first() is not None
+        
 
-        # Verify NULLABLE attributes
-        for attr in ('source', 'source_item_id', 'submitter_id', 'submitted_on'):
-            self.assertIsNone(getattr(retrieved_bookmark, attr))
+class BookmarkTests(BookmarkDaoTestCase):
+    """Verify Bookmark ORM."""
 
-        q = self.session.query(Bookmark)
-        q = q.order_by(Bookmark.sort_date)
-        foo = q.all()
-        self.assertEqual(1, len(foo))
+    _description = "Peanuts do not grow on trees!"
+    _display_date_format = '%Y.%m'
+    _status = 'duplicate'
+    _source = 'raindrop'
+    _source_item_id = '1234-abc'
+    _source_last_updated = datetime(2017, 2, 7, 23, 10, tzinfo=UTC)
+    _submitter_id = 'aladdin'
+    _submitted_on = datetime(2017, 2, 8, 7, 45, tzinfo=UTC)
 
-    def test_bookmark__all(self):
-        """Verify Bookmark creation with all data specified."""
-        bookmark = Bookmark(
-            bookmark_id=self._bookmark_id,
-            url=self._url,
-            summary=self._summary,
-            sort_date=self._sort_date,
-            description=self._description,
-            display_date_format=self._display_date_format,
-            status=self._status,
-            source=self._source,
-            source_item_id=self._source_item_id,
-            source_last_updated=self._source_last_updated,
-            submitter_id=self._submitter_id,
-            submitted_on=self._submitted_on)
-        self._save_bookmark(bookmark)
-        bookmarks = self.session.query(Bookmark).all()
-        self.assertEqual(1, len(bookmarks))
-        retrieved_bookmark = bookmarks[0]
-
-        # Verify newly-specified attributes
-        self.assertEqual(self._bookmark_id, retrieved_bookmark.bookmark_id)
-        self.assertEqual(self._description, retrieved_bookmark.description)
-        self.assertEqual(self._display_date_format, retrieved_bookmark.display_date_format)
-        self.assertEqual(self._status, retrieved_bookmark.status)
-        self.assertEqual(self._source, retrieved_bookmark.source)
-        self.assertEqual(self._source_item_id, retrieved_bookmark.source_item_id)
-        self.assertEqual(self._source_last_updated, retrieved_bookmark.source_last_updated)
-        self.assertEqual(self._submitter_id, retrieved_bookmark.submitter_id)
-        self.assertEqual(self._submitted_on, retrieved_bookmark.submitted_on)
-
-    def test_bookmark__specify_bookmark_id(self):
-        """Verify Bookmark creation with specified bookmark_id."""
-        bookmark = Bookmark(
-            bookmark_id=self._bookmark_id,
-            url=self._url,
-            summary=self._summary,
-            sort_date=self._sort_date)
-        self._save_bookmark(bookmark)
+    def _verify_saved_bookmark(self, attrs, expected_attrs):
+        """Save Bookmark created with attrs and verify that it is retrieved with expected_attrs.
 
-        bookmarks = self.session.query(Bookmark).all()
-        self.assertEqual(1, len(bookmarks))
-        retrieved_bookmark = bookmarks[0]
-        self.assertEqual(self._bookmark_id, retrieved_bookmark.bookmark_id)
+        The bookmark is saved within its own savepoint, which is rolled back afterwards.
+        """
+        savepoint = _connection.begin_nested()
+        try:
+            self._save_bookmark(Bookmark(**attrs))
+            # Raises unless exactly one bookmark was saved
+            retrieved_bookmark = self.session.query(Bookmark).one()
+
+            self.assertTrue(isinstance(retrieved_bookmark.bookmark_id, uuid.UUID))
+            for attr, expected_value in expected_attrs.items():
+                self.assertEqual(expected_value, getattr(retrieved_bookmark, attr), attr)
+        finally:
+            Session.remove()
+            savepoint.rollback()
+
+    def test_bookmark(self):
+        """Verify Bookmark creation with only required data, with all data, and with specified bookmark_id."""
+        required_attrs = {'url': self._url,
+                          'summary': self._summary,
+                          'sort_date': self._sort_date}
+        all_attrs = dict(required_attrs,
+                         bookmark_id=self._bookmark_id,
+                         description=self._description,
+                         display_date_format=self._display_date_format,
+                         status=self._status,
+                         source=self._source,
+                         source_item_id=self._source_item_id,
+                         source_last_updated=self._source_last_updated,
+                         submitter_id=self._submitter_id,
+                         submitted_on=self._submitted_on)
+
+        # Unspecified attributes take defaults or are NULL
+        required_expected_attrs = dict(required_attrs,
+                                       status='new',
+                                       display_date_format='%Y.%m.%d',
+                                       source=None,
+                                       source_item_id=None,
+                                       submitter_id=None,
+                                       submitted_on=None)
+
+        cases = [('required', required_attrs, required_expected_attrs),
+                 ('all', all_attrs, all_attrs),
+                 ('specify_bookmark_id', dict(required_attrs, bookmark_id=self._bookmark_id),
+                  {'bookmark_id': self._bookmark_id})]
+        for name, attrs, expected_attrs in cases:
+            with self.subTest(name=name):
+                self._verify_saved_bookmark(attrs, expected_attrs)
 
 
 class BookmarkCreateTests(BookmarkDaoTestCase):
     """Verify create_bookmark behavior."""
 
-    def setUp(self):
-        super(BookmarkCreateTests, self).setUp()
-        self._display_date = self._sort_date.strftime("%Y.%m.%d")
-
-    def _create_bookmark(self, **kwargs):
-        """Wrapper around Bookmark.create_bookmark that registers bookmark_id for cleanup."""
-        bookmark = Bookmark.create_bookmark(**kwargs)
-        self._test_bookmark_ids.append(bookmark.bookmark_id)
-        return bookmark
+    # display_date that is _sort_date in %Y.%m.%d format
+    _display_date = "2017.02.07"
 
     def _select_topics(self):
         """Select all topics."""
         return self.session.query(BookmarkTopic).all()
 
-    @patch.object(Bookmark, '_parse_display_date')
-    def test_create_bookmark__simple(self, mock_parse_display_date):
+    def test_create_bookmark__simple(self):
         """Verify bookmark creation with only required args."""
-        # Set up mocks and test data
+        # Set up test data
         test_date_format = 'foo'
-        mock_parse_display_date.return_value = (self._sort_date, test_date_format)
 
         # Create bookmark
         args = {'summary': self._summary,
                 'url': self._url,
                 'display_date': self._sort_date}
-        bookmark = self._create_bookmark(**args)
+        with self._patch_parse_date(return_value=(self._sort_date, test_date_format)) as mock_parse_date:
+            bookmark = Bookmark.create_bookmark(**args)
         
         # Verify result
         self.assertIsNotNone(bookmark)
@@ -195,23 +334,22 @@ class BookmarkCreateTests(BookmarkDaoTestCase):
         self.assertIsNone(bookmark.submitted_on)
 
         # Verify mocks
-        mock_parse_display_date.assert_called_once_with(self._sort_date)
+        mock_parse_date.assert_called_once_with(self._sort_date)
 
         # Verify bookmark is persisted to database
-        self.session.flush()
         self.session.commit()
         self.assertEqual(bookmark, self._select_bookmark(bookmark.bookmark_id))
 
     def test_create_bookmark__bookmark_id(self):
         """Verify bookmark creation with specified bookmark_id."""
         # Create bookmark
-        bookmark_id = uuid.uuid4()
+        bookmark_id = uuid.UUID(int=101)
         args = {'summary': self._summary,
                 'url': self._url,
                 'display_date': self._display_date,
                 'bookmark_id': bookmark_id
                 }
-        bookmark = self._create_bookmark(**args)
+        bookmark = Bookmark.create_bookmark(**args)
         self.assertEqual(bookmark_id, bookmark.bookmark_id)
 
     def test_create_bookmark__description(self):
@@ -221,21 +359,19 @@ class BookmarkCreateTests(BookmarkDaoTestCase):
                 'display_date': self._display_date,
                 'description': 'eeny meeny miney mo'
                 }
-        bookmark = self._create_bookmark(**args)
+        bookmark = Bookmark.create_bookmark(**args)
         self.assertEqual('eeny meeny miney mo', bookmark.description)
 
-    @patch.object(BookmarkStatus, 'assert_valid_original_status')
-    def test_create_bookmark__submitted(self, mock_assert_valid_orig_status):
+    def test_create_bookmark__submitted(self):
         """Verify Bookmark creation with status 'submitted'."""
         args = {'summary': self._summary,
                 'url': self._url,
                 'display_date': self._display_date,
                 'status': 'submitted'
                 }
-        bookmark = self._create_bookmark(**args)
+        bookmark = Bookmark.create_bookmark(**args)
         self.assertEqual('submitted', bookmark.status)
         self.assertIsNotNone(bookmark.submitted_on)
-        mock_assert_valid_orig_status.assert_called_once_with(BookmarkStatus.SUBMITTED)
 
     def test_create_bookmark__submitted_ci(self):
         """Verify Bookmark creation with status 'SUBMITTED'."""
@@ -245,7 +381,7 @@ class BookmarkCreateTests(BookmarkDaoTestCase):
                 'display_date': self._display_date,
                 'status': 'SUBMITTED'
                 }
-        bookmark = self._create_bookmark(**args)
+        bookmark = Bookmark.create_bookmark(**args)
         self.assertEqual('submitted', bookmark.status)
         self.assertTrue(utcnow <= bookmark.submitted_on)
 
@@ -257,7 +393,7 @@ class BookmarkCreateTests(BookmarkDaoTestCase):
                 'display_date': self._display_date,
                 'topics': ['ada', 'fortran', 'pascal']
                 }
-        bookmark = self._create_bookmark(**args)
+        bookmark = Bookmark.create_bookmark(**args)
         self.assertEqual(set(args['topics']), set([t.topic for t in bookmark.topics]))
 
         # Verify that topics were created
@@ -266,64 +402,17 @@ class BookmarkCreateTests(BookmarkDaoTestCase):
         for t in topics:
             self.assertEqual(bookmark.bookmark_id, t.bookmark_id)
 
-    def test_create_bookmark__missing_required_arg(self):
-        """Verify bookmark creation without required args raises."""
-
-        def get_args():
-            return {'summary': self._summary,
-                    'url': self._url,
-                    'display_date': self._sort_date}
-        for required_key in ('summary', 'url', 'display_date'):
-            args = get_args()
-            del args[required_key]
-            self.assertRaisesRegex(ValueError,
-                                   "Missing required argument.*{0}".format(required_key),
-                                   self._create_bookmark,
-                                   **args)
-            
-    @patch.object(Bookmark, '_parse_display_date')
-    def test_create_bookmark__invalid_date_format(self, mock_parse_display_date):
+    def test_create_bookmark__invalid_date_format(self):
         """Verify create_bookmark raises if date_format is unrecognized."""
-        mock_parse_display_date.side_effect = ValueError('bad format')
         args = {'summary': self._summary,
                 'url': self._url,
                 'display_date': self._display_date
                 }
-        self.assertRaisesRegex(ValueError,
-                               'bad format',
-                               self._create_bookmark,
-                               **args)
-
-    @patch.object(BookmarkStatus, 'assert_valid_original_status')
-    def test_create_bookmark__invalid_status(self, mock_assert_valid_orig_status):
-        """Verify create_bookmark raises if assert_valid_original_status raises."""
-        mock_assert_valid_orig_status.side_effect = ValueError("Bad dog")
-        args = {'summary': self._summary,
-                'url': self._url,
-                'display_date': self._display_date,
-                'status': 'freida'
-                }
-        self.assertRaisesRegex(ValueError,
-                               "Bad dog",
-                               self._create_bookmark,
-                               **args)
-
-    def test_create_bookmark__extra_args(self):
-        """Verify create_bookmark raises if unrecognized args are provided.
-
-        Note that even some Bookmark attributes are not allowed as args to create_bookmark.
-        """
-        args = {'summary': self._summary,
-                'url': self._url,
-                'display_date': self._display_date,
-                'sort_date': datetime.utcnow(),
-                'submitted_on': datetime.utcnow(),
-                'ice_cream': 'chocolate'}
-        self.assertRaisesRegex(
-            ValueError,
-            'Unexpected arguments.*create_bookmark.*ice_cream.*sort_date.*submitted_on',
-            self._create_bookmark,
-            **args)
+        with self._patch_parse_date(side_effect=DateParseError('bad format')):
+            self.assertRaisesRegex(ValueError,
+                                   'bad format',
+                                   Bookmark.create_bookmark,
+                                   **args)
 
 
 class BookmarkSelectTests(BookmarkDaoTestCase):
@@ -340,16 +429,14 @@ class BookmarkSelectTests(BookmarkDaoTestCase):
 
     def test_select_bookmarks(self):
         """Verify Bookmark.select_bookmarks result."""
-        today = datetime.utcnow().replace(tzinfo=pytz.utc)
-        today_bookmark = TestDaoFactory.create_bookmark(sort_date=today)
-        yesterday_bookmark = TestDaoFactory.create_bookmark(sort_date=today - timedelta(days=1))
-        saved_bookmarks = [self._save_bookmark(b) for b in [today_bookmark, yesterday_bookmark]]
-        self.session.flush()
-        self.session.commit()
+        today = datetime.now(UTC)
+        today_bookmark = TestDaoFactory.bookmark_attrs(sort_date=today)
+        yesterday_bookmark = TestDaoFactory.bookmark_attrs(sort_date=today - timedelta(days=1))
+        self._insert_bookmarks([today_bookmark, yesterday_bookmark])
 
         # Verify expected ids in expected order (ascending by date)
         selected_bookmarks, cursor = Bookmark.select_bookmarks()
-        self.assertEqual([yesterday_bookmark.bookmark_id, today_bookmark.bookmark_id],
+        self.assertEqual([yesterday_bookmark['bookmark_id'], today_bookmark['bookmark_id']],
                          [b.bookmark_id for b in selected_bookmarks])
         self.assertTrue(isinstance(cursor, str))
 
@@ -361,10 +448,7 @@ class BookmarkSelectTests(BookmarkDaoTestCase):
         other_topic_bookmark = TestDaoFactory.create_bookmark(
             topics=[TestDaoFactory.create_bookmark_topic(topic="Aloha World")])
         no_topic_bookmark = TestDaoFactory.create_bookmark()
-        saved_bookmarks = [self._save_bookmark(b) for b in 
-                           [other_topic_bookmark, topic_bookmark, no_topic_bookmark]]
-        self.session.flush()
-        self.session.commit()
+        self._save_bookmarks([other_topic_bookmark, topic_bookmark, no_topic_bookmark])
 
         # Verify selection
         selected_bookmarks, cursor = Bookmark.select_bookmarks(topics=[topic])
@@ -377,10 +461,7 @@ class BookmarkSelectTests(BookmarkDaoTestCase):
         other_topic_bookmark = TestDaoFactory.create_bookmark(
             topics=[TestDaoFactory.create_bookmark_topic(topic="Aloha World")])
         no_topic_bookmark = TestDaoFactory.create_bookmark()
-        saved_bookmarks = [self._save_bookmark(b) for b in 
-                           [other_topic_bookmark, no_topic_bookmark]]
-        self.session.flush()
-        self.session.commit()
+        self._save_bookmarks([other_topic_bookmark, no_topic_bookmark])
 
         # Verify selection
         self.assertEqual(([], None), Bookmark.select_bookmarks(topics=[topic]))
@@ -394,10 +475,7 @@ class BookmarkSelectTests(BookmarkDaoTestCase):
             topics=[TestDaoFactory.create_bookmark_topic(topic=topics[1])])
         other_topic_bookmark = TestDaoFactory.create_bookmark(
             topics=[TestDaoFactory.create_bookmark_topic(topic="Banana Bread")])
-        saved_bookmarks = [self._save_bookmark(b) for b in 
-                           [other_topic_bookmark, topic_zero_bookmark, topic_one_bookmark]]
-        self.session.flush()
-        self.session.commit()
+        self._save_bookmarks([other_topic_bookmark, topic_zero_bookmark, topic_one_bookmark])
 
         # Verify selection: Should be OR of bookmarks with any specified topic
         selected_bookmarks, cursor = Bookmark.select_bookmarks(topics=topics)
@@ -410,9 +488,7 @@ class BookmarkSelectTests(BookmarkDaoTestCase):
         topics = ["Hello World", "Aloha World"]
         double_match_bookmark = TestDaoFactory.create_bookmark(
             topics=[TestDaoFactory.create_bookmark_topic(topic=t) for t in topics])
-        saved_bookmarks = [self._save_bookmark(double_match_bookmark)]
-        self.session.flush()
-        self.session.commit()
+        self._save_bookmarks([double_match_bookmark])
 
         # Verify selection: Should be length 1
         selected_bookmarks, cursor = Bookmark.select_bookmarks(topics=topics)
@@ -421,15 +497,16 @@ class BookmarkSelectTests(BookmarkDaoTestCase):
 
     def test_select_bookmarks__cursor(self):
         """Verify cursor functionality of select_bookmarks."""
-        today = datetime.utcnow().replace(tzinfo=pytz.utc, microsecond=0)
-        today_bookmark = TestDaoFactory.create_bookmark(sort_date=today)
-        yesterday_bookmark_ids = sorted([uuid.uuid4(), uuid.uuid4()])
-        yesterday_bookmark_1 = TestDaoFactory.create_bookmark(sort_date=(today-timedelta(days=1)), bookmark_id=yesterday_bookmark_ids[0])
-        yesterday_bookmark_2 = TestDaoFactory.create_bookmark(sort_date=(today-timedelta(days=1)), bookmark_id=yesterday_bookmark_ids[1])
-        two_days_ago_bookmark = TestDaoFactory.create_bookmark(sort_date=today-timedelta(days=2))
-        saved_bookmarks = [self._save_bookmark(b) for b in [today_bookmark, two_days_ago_bookmark, yesterday_bookmark_2, yesterday_bookmark_1]]
-        self.session.flush()
-        self.session.commit()
+        today = datetime.now(UTC).replace(microsecond=0)
+        today_bookmark = TestDaoFactory.bookmark_attrs(sort_date=today)
+        # Fixed, ascending ids order the two bookmarks with the same sort_date
+        yesterday_bookmark_ids = [uuid.UUID(int=1), uuid.UUID(int=2)]
+        yesterday_bookmark_1 = TestDaoFactory.bookmark_attrs(sort_date=(today-timedelta(days=1)),
+                                                              bookmark_id=yesterday_bookmark_ids[0])
+        yesterday_bookmark_2 = TestDaoFactory.bookmark_attrs(sort_date=(today-timedelta(days=1)),
+                                                              bookmark_id=yesterday_bookmark_ids[1])
+        two_days_ago_bookmark = TestDaoFactory.bookmark_attrs(sort_date=today-timedelta(days=2))
+        self._insert_bookmarks([today_bookmark, two_days_ago_bookmark, yesterday_bookmark_2, yesterday_bookmark_1])
 
         # Expected return order: 
         #  two_days_ago_bookmark
@@ -439,53 +516,81 @@ class BookmarkSelectTests(BookmarkDaoTestCase):
         
         # Select first two records
         selected_bookmarks, cursor = Bookmark.select_bookmarks(max_results=2)
-        self.assertEqual([two_days_ago_bookmark.bookmark_id, yesterday_bookmark_1.bookmark_id],
+        self.assertEqual([two_days_ago_bookmark['bookmark_id'], yesterday_bookmark_1['bookmark_id']],
                          [b.bookmark_id for b in selected_bookmarks])
         self.assertIsNotNone(cursor)
 
         # Select next one record
         selected_bookmarks, cursor = Bookmark.select_bookmarks(cursor=cursor, max_results=1)
-        self.assertEqual([yesterday_bookmark_2.bookmark_id], [b.bookmark_id for b in selected_bookmarks])
+        self.assertEqual([yesterday_bookmark_2['bookmark_id']], [b.bookmark_id for b in selected_bookmarks])
         self.assertIsNotNone(cursor)
 
         # Select last record
         selected_bookmarks, cursor = Bookmark.select_bookmarks(cursor=cursor)
-        self.assertEqual([today_bookmark.bookmark_id], [b.bookmark_id for b in selected_bookmarks])
+        self.assertEqual([today_bookmark['bookmark_id']], [b.bookmark_id for b in selected_bookmarks])
         self.assertIsNotNone(cursor)
 
         # No more records
         selected_bookmarks, cursor = Bookmark.select_bookmarks(cursor=cursor)
         self.assertEqual([], selected_bookmarks)
         self.assertIsNone(cursor)
-        
+
+    def test_select_bookmarks__invalid_cursor(self):
+        """Verify that select_bookmarks raises ValueError for malformed cursor."""
+        for cursor, message in (('2017-02-08T07:45:00', "expected 'sort_date|bookmark_id'"),
+                                ('2017.02.08|{0}'.format(uuid.UUID(int=1)), "sort_date '2017.02.08'"),
+                                ('2017-02-08T07:45:00|not-a-uuid', "bookmark_id 'not-a-uuid' is not a UUID")):
+            with self.subTest(cursor=cursor):
+                self.assertRaisesRegex(ValueError, message, Bookmark.select_bookmarks, cursor=cursor)
+
+
+class BookmarkSelectByIdTests(BookmarkDaoTestCase):
+    """Verify Bookmark.select_bookmark_by_id.
+
+    The test bookmark and one other bookmark are saved once for the class.
+    """
+
+    _SEED_TEST_BOOKMARK = True
+
+    @classmethod
+    def setUpClass(cls):
+        super(BookmarkSelectByIdTests, cls).setUpClass()
+        session = Session.get()
+        session.execute(sa.insert(Bookmark), [TestDaoFactory.bookmark_attrs()])
+        session.commit()
+        Session.remove()
 
     def test_select_bookmark_by_id(self):
         """Verify Bookmark.select_bookmark_by_id."""
-        match_bookmark = TestDaoFactory.create_bookmark()
-        other_bookmark = TestDaoFactory.create_bookmark()
-        saved_bookmarks = [self._save_bookmark(b) for b in [other_bookmark, match_bookmark]]
-        self.session.flush()
-        self.session.commit()
-
-        # Verify selection
-        selected_bookmark = Bookmark.select_bookmark_by_id(match_bookmark.bookmark_id)
-        self.assertEqual(match_bookmark.bookmark_id, selected_bookmark.bookmark_id)
+        selected_bookmark = Bookmark.select_bookmark_by_id(self._bookmark_id)
+        self.assertEqual(self._bookmark_id, selected_bookmark.bookmark_id)
 
     def test_select_bookmark_by_id__no_bookmark(self):
         """Verify Bookmark.select_bookmark_by_id when on such bookmark exists."""
-        bookmark = TestDaoFactory.create_bookmark()
-        other_bookmark = TestDaoFactory.create_bookmark()
-        saved_bookmarks = [self._save_bookmark(b) for b in [other_bookmark, bookmark]]
-        self.session.flush()
-        self.session.commit()
-
-        # Verify selection
         self.assertIsNone(Bookmark.select_bookmark_by_id(uuid.uuid4()))
 
+    def test_select_bookmark_by_id__str(self):
+        """Verify that bookmark id string is bound as UUID, and the id is read back as UUID."""
+        self.session.expunge_all()
+        selected_bookmark = Bookmark.select_bookmark_by_id(str(self._bookmark_id))
+        self.assertIsInstance(selected_bookmark.bookmark_id, uuid.UUID)
+        self.assertEqual(self._bookmark_id, selected_bookmark.bookmark_id)
+
+    def test_select_bookmark_by_id__invalid_id(self):
+        """Verify select_bookmark_by_id raises if bookmark_id is not a UUID."""
+        self.assertRaisesRegex(ValueError,
+                               "Invalid bookmark id 'not-a-uuid'",
+                               Bookmark.select_bookmark_by_id,
+                               'not-a-uuid')
+
 
 class BookmarkUpdateTests(BookmarkDaoTestCase):
     """Verify update_bookmark behavior."""
 
+    # Patchers are built once per class and applied within individual tests
+    _patch_update_status = patch.object(Bookmark, 'update_status')
+    _patch_update_topics = patch.object(Bookmark, 'update_topics')
+
     def test_update__simple(self):
         """Verify update of url, summary and description."""
         url = "http://latimes.com/news/article.html"
@@ -507,9 +612,9 @@ class BookmarkUpdateTests(BookmarkDaoTestCase):
         self.assertIsNotNone(updated_bookmark)
         self.assertEqual(test_bookmark.bookmark_id, updated_bookmark.bookmark_id)
 
-        # Clear session and re-select bookmark to verify that it was persisted
+        # Expire session state and re-select bookmark to verify that it was persisted
         self.session.flush()
-        self.session.commit()
+        self.session.expire_all()
         selected_bookmark = self._select_bookmark(test_bookmark.bookmark_id)
         self.assertIsNotNone(selected_bookmark)
 
@@ -524,20 +629,6 @@ class BookmarkUpdateTests(BookmarkDaoTestCase):
                          'submitted_on', 'topics'):
                 self.assertEqual(getattr(test_bookmark, attr), getattr(bookmark, attr))
                                                     
-    def test_update__clear_required_attr(self):
-        """Verify that attempt to clear url, summary, or display_date_format raises."""
-        # Create test bookmark
-        test_bookmark = self._create_test_bookmark()
-
-        # Attempt to clear required data
-        for attr in ('url', 'summary', 'display_date', 'status'):
-            for empty_val in ('', None):
-                self.assertRaisesRegex(ValueError,
-                                       ".*empty.*None.*{0}".format(attr),
-                                       Bookmark.update_bookmark,
-                                       test_bookmark.bookmark_id, 
-                                       **{attr: empty_val})
-
     def test_update__clear_optional_attr(self):
         """Verify that optional attributes can be cleared."""
         # Create test bookmark
@@ -549,28 +640,26 @@ class BookmarkUpdateTests(BookmarkDaoTestCase):
             updated_bookmark = Bookmark.update_bookmark(test_bookmark.bookmark_id, description=empty_val)
             self.assertIsNone(updated_bookmark.description)
         
-    @patch.object(Bookmark, '_parse_display_date')
-    def test_update__display_date(self, mock_parse_display_date):
+    def test_update__display_date(self):
         """Verify results and calls made when display_date is updated."""
 
         # Create test bookmark
         test_bookmark = self._create_test_bookmark()
         
-        # Set up mocks
+        # Set up test data
         new_sort_date = test_bookmark.sort_date + timedelta(hours=12)
         new_format = 'foo'
-        mock_parse_display_date.return_value = (new_sort_date, new_format)
 
         # Update display_date
-        updated_bookmark = Bookmark.update_bookmark(test_bookmark.bookmark_id, display_date='something')
+        with self._patch_parse_date(return_value=(new_sort_date, new_format)) as mock_parse_date:
+            updated_bookmark = Bookmark.update_bookmark(test_bookmark.bookmark_id, display_date='something')
         self.assertEqual(new_sort_date, updated_bookmark.sort_date)
         self.assertEqual(new_format, updated_bookmark.display_date_format)
 
         # Verify mock
-        mock_parse_display_date.assert_called_once_with('something')
+        mock_parse_date.assert_called_once_with('something')
 
-    @patch.object(Bookmark, 'update_status')
-    def test_update__status(self, mock_update_status):
+    def test_update__status(self):
         """Verify that appropriate call is made when status is updated."""
 
         # Create test bookmark
@@ -578,13 +667,13 @@ class BookmarkUpdateTests(BookmarkDaoTestCase):
         
         # Update status
         mock_status = Mock(name='updated_status')
-        updated_bookmark = Bookmark.update_bookmark(test_bookmark.bookmark_id, status=mock_status)
+        with self._patch_update_status as mock_update_status:
+            updated_bookmark = Bookmark.update_bookmark(test_bookmark.bookmark_id, status=mock_status)
 
         # Verify mock
         mock_update_status.assert_called_once_with(mock_status.lower())
 
-    @patch.object(Bookmark, 'update_topics')
-    def test_update__topics(self, mock_update_topics):
+    def test_update__topics(self):
         """Verify that appropriate call is made when topics are updated."""
 
         # Create test bookmark
@@ -592,41 +681,21 @@ class BookmarkUpdateTests(BookmarkDaoTestCase):
         
         # Update topics
         mock_topics = Mock(name='updated_topics')
-        updated_bookmark = Bookmark.update_bookmark(test_bookmark.bookmark_id, topics=mock_topics)
+        with self._patch_update_topics as mock_update_topics:
+            updated_bookmark = Bookmark.update_bookmark(test_bookmark.bookmark_id, topics=mock_topics)
 
         # Verify mock
         mock_update_topics.assert_called_once_with(mock_topics)
 
-    def test_update__other_attrs(self):
-        """Verify that attempt to update other attributes raises."""
-        # Create test bookmark
-        test_bookmark = self._create_test_bookmark()
-
-        attrs = {'sort_date': datetime.utcnow(), 
-                 'foo': 'hi',
-                 'submitted_on': datetime.utcnow()}
-        self.assertRaisesRegex(ValueError,
-                               "Unexpected arguments.*update_bookmark.*foo.*sort_date.*submitted_on",
-                               Bookmark.update_bookmark,
-                               test_bookmark.bookmark_id, 
-                               **attrs)
-
-    @patch.object(BookmarkStatus, 'assert_valid_status_transition')
-    def test_update_status(self, mock_assert_valid_transition):
+    def test_update_status(self):
         """Verify update_status method when status and transition are valid."""
-        # Set up mocks
-        mock_new_status = 'new_status'
-
         # Create test bookmark and verify expected status
         test_bookmark = self._create_test_bookmark()
         self.assertEqual(BookmarkStatus.NEW, test_bookmark.status)
 
         # Update status
-        test_bookmark.update_status(mock_new_status)
-        self.assertEqual(mock_new_status, test_bookmark.status)
-
-        # Verify mocks
-        mock_assert_valid_transition.assert_called_once_with(BookmarkStatus.NEW, mock_new_status)
+        test_bookmark.update_status(BookmarkStatus.ACCEPTED)
+        self.assertEqual(BookmarkStatus.ACCEPTED, test_bookmark.status)
 
     def test_update_status__submitted(self):
         """Verify update_status method sets submitted_on when status is updated to 'submitted.'"""
@@ -663,40 +732,36 @@ class BookmarkUpdateTests(BookmarkDaoTestCase):
         self.assertEqual(BookmarkStatus.SUBMITTED, test_bookmark.status)
         self.assertEqual(orig_submitted_on, test_bookmark.submitted_on)
         
-    @patch.object(BookmarkStatus, 'assert_valid_status_transition')
-    def test_update_status__invalid_transition(self, mock_assert_valid_transition):
+    def test_update_status__invalid_transition(self):
         """Verify update_status method when transition is invalid."""
-        # Set up mocks
-        mock_assert_valid_transition.side_effect = ValueError("Smart turtle")
-        mock_new_status = 'new_status'
-
         # Create test bookmark 
-        test_bookmark = self._create_test_bookmark()
+        test_bookmark = self._create_test_bookmark(status=BookmarkStatus.SUBMITTED)
 
         # Update status
         self.assertRaisesRegex(
             ValueError,
-            "Smart turtle",
+            "Invalid bookmark status transition 'submitted' -> 'new'",
             test_bookmark.update_status,
-            mock_new_status)
+            BookmarkStatus.NEW)
+        self.assertEqual(BookmarkStatus.SUBMITTED, test_bookmark.status)
 
     def test_update_topics(self):
         """Verify that topics can be added, removed, and left alone."""
         test_bookmark = self._create_test_bookmark(topic_names=['keeper', 'loser'])
         self.assertEqual(2, len(test_bookmark.topics))
-        self.assertEqual(set(['keeper', 'loser']), set([t.topic for t in test_bookmark.topics]))
-        keeper_created_on = [t.created_on for t in test_bookmark.topics if t.topic == 'keeper'][0]
+        self.assertEqual({'keeper', 'loser'}, {t.topic for t in test_bookmark.topics})
+        keeper_created_on = next(t.created_on for t in test_bookmark.topics if t.topic == 'keeper')
 
         # Update topics
         test_bookmark.update_topics(['new', 'keeper'])
         self.assertEqual(2, len(test_bookmark.topics))
-        self.assertEqual(set(['keeper', 'new']), set([t.topic for t in test_bookmark.topics]))
-        self.assertEqual(keeper_created_on, [t.created_on for t in test_bookmark.topics if t.topic == 'keeper'][0])
+        self.assertEqual({'keeper', 'new'}, {t.topic for t in test_bookmark.topics})
+        self.assertEqual(keeper_created_on, next(t.created_on for t in test_bookmark.topics if t.topic == 'keeper'))
         self.session.merge(test_bookmark)
 
         # Verify that dropped topic is really gone
         topics = self.session.query(BookmarkTopic).filter_by(bookmark_id=test_bookmark.bookmark_id).all()
-        self.assertEqual(set(['keeper', 'new']), set([t.topic for t in topics]))
+        self.assertEqual({'keeper', 'new'}, {t.topic for t in topics})
 
     def test_update_topics__clear_topics__empty_list(self):
         """Verify that topics can be cleared by updating to empty list."""
@@ -726,6 +791,129 @@ class BookmarkUpdateTests(BookmarkDaoTestCase):
         topics = self.session.query(BookmarkTopic).filter_by(bookmark_id=test_bookmark.bookmark_id).all()
         self.assertEqual(0, len(topics))
 
+    def test_update_topics__clear_topics__not_loaded(self):
+        """Verify that topics can be cleared without loading them."""
+        test_bookmark = self._create_test_bookmark(topic_names=['apple', 'banana'])
+        self.session.expire(test_bookmark, ['topics'])
+
+        test_bookmark.update_topics([])
+        self.assertEqual([], test_bookmark.topics)
+        self.session.flush()
+
+        topics = self.session.query(BookmarkTopic).filter_by(bookmark_id=test_bookmark.bookmark_id).all()
+        self.assertEqual(0, len(topics))
+
+
+class BookmarkValidationTests(unittest.TestCase):
+    """Verify argument validation in create_bookmark and update_bookmark.
+
+    Validation happens before anything is written, so these tests do not use the database.
+    """
+
+    _url = "http://nytimes.com/news/article.html"
+    _summary = "Good article about peanuts"
+    _display_date = "2017.02.07"
+
+    def setUp(self):
+        # Fail fast on any database access
+        session_patcher = patch.object(Session, 'get', side_effect=AssertionError("Unexpected database access"))
+        session_patcher.start()
+        self.addCleanup(session_patcher.stop)
+
+        # update_bookmark validates its arguments after selecting the bookmark to be updated
+        self._test_bookmark = TestDaoFactory.create_bookmark()
+        select_patcher = patch.object(Bookmark, 'select_bookmark_by_id', return_value=self._test_bookmark)
+        select_patcher.start()
+        self.addCleanup(select_patcher.stop)
+
+    def test_create_bookmark__missing_required_arg(self):
+        """Verify bookmark creation without required args raises."""
+
+        def get_args():
+            return {'summary': self._summary,
+                    'url': self._url,
+                    'display_date': self._display_date}
+        for required_key in ('summary', 'url', 'display_date'):
+            args = get_args()
+            del args[required_key]
+            self.assertRaisesRegex(ValueError,
+                                   "Missing required argument.*{0}".format(required_key),
+                                   Bookmark.create_bookmark,
+                                   **args)
+
+    def test_create_bookmark__invalid_status(self):
+        """Verify create_bookmark raises if status is not a valid original status."""
+        args = {'summary': self._summary,
+                'url': self._url,
+                'display_date': self._display_date,
+                'status': 'freida'
+                }
+        self.assertRaisesRegex(ValueError,
+                               "Invalid bookmark status for new bookmark 'freida'",
+                               Bookmark.create_bookmark,
+                               **args)
+
+    def test_create_bookmark__extra_args(self):
+        """Verify create_bookmark raises if unrecognized args are provided.
+
+        Note that even some Bookmark attributes are not allowed as args to create_bookmark.
+        """
+        args = {'summary': self._summary,
+                'url': self._url,
+                'display_date': self._display_date,
+                'sort_date': datetime.utcnow(),
+                'submitted_on': datetime.utcnow(),
+                'ice_cream': 'chocolate'}
+        self.assertRaisesRegex(
+            ValueError,
+            'Unexpected arguments.*create_bookmark.*ice_cream.*sort_date.*submitted_on',
+            Bookmark.create_bookmark,
+            **args)
+
+    def test_create_bookmark__invalid_bookmark_id(self):
+        """Verify create_bookmark raises if specified bookmark_id is not a UUID."""
+        self.assertRaisesRegex(ValueError,
+                               "Invalid bookmark id 'not-a-uuid'",
+                               Bookmark.create_bookmark,
+                               summary=self._summary, url=self._url, display_date=self._display_date,
+                               bookmark_id='not-a-uuid')
+
+    def test_update__invalid_bookmark_id(self):
+        """Verify update_bookmark raises if bookmark_id is not a UUID."""
+        self.assertRaisesRegex(ValueError,
+                               "Invalid bookmark id 'not-a-uuid'",
+                               Bookmark.update_bookmark,
+                               'not-a-uuid',
+                               summary=self._summary)
+
+    def test_delete__invalid_bookmark_id(self):
+        """Verify delete_bookmark raises if bookmark_id is not a UUID."""
+        self.assertRaisesRegex(ValueError,
+                               "Invalid bookmark id 'not-a-uuid'",
+                               Bookmark.delete_bookmark,
+                               'not-a-uuid')
+
+    def test_update__clear_required_attr(self):
+        """Verify that attempt to clear url, summary, or display_date_format raises."""
+        for attr in ('url', 'summary', 'display_date', 'status'):
+            for empty_val in ('', None):
+                self.assertRaisesRegex(ValueError,
+                                       ".*empty.*None.*{0}".format(attr),
+                                       Bookmark.update_bookmark,
+                                       self._test_bookmark.bookmark_id,
+                                       **{attr: empty_val})
+
+    def test_update__other_attrs(self):
+        """Verify that attempt to update other attributes raises."""
+        attrs = {'sort_date': datetime.utcnow(), 
+                 'foo': 'hi',
+                 'submitted_on': datetime.utcnow()}
+        self.assertRaisesRegex(ValueError,
+                               "Unexpected arguments.*update_bookmark.*foo.*sort_date.*submitted_on",
+                               Bookmark.update_bookmark,
+                               self._test_bookmark.bookmark_id, 
+                               **attrs)
+
 
 class BookmarkDeleteTests(BookmarkDaoTestCase):
     """Verify Bookmark.delete_bookmark."""
@@ -733,43 +921,43 @@ class BookmarkDeleteTests(BookmarkDaoTestCase):
     def test_delete(self):
         """Verify that bookmark is deleted."""
         test_bookmark = self._create_test_bookmark()
-        self.session.flush()
         self.session.commit()
         self.assertIsNotNone(self._select_bookmark(test_bookmark.bookmark_id))
                              
         Bookmark.delete_bookmark(test_bookmark.bookmark_id)
-        self.session.flush()
         self.session.commit()
         self.assertIsNone(self._select_bookmark(test_bookmark.bookmark_id))
 
     def test_delete__no_such_bookmark(self):
         """Verify that delete_bookmark does no harm if bookmark does not exist."""
         Bookmark.delete_bookmark(uuid.uuid4())
-        self.session.flush()
         self.session.commit()
 
 
 class BookmarkTopicTests(BookmarkDaoTestCase):
     """Verify BookmarkTopic ORM."""
 
-    def setUp(self):
-        super(BookmarkTopicTests, self).setUp()
-        self._topic = 'Test Topic'
-        self._created_on = datetime.utcnow().replace(tzinfo=pytz.utc)
+    _SEED_TEST_BOOKMARK = True
+
+    _topic = 'Test Topic'
+    _created_on = datetime(2017, 2, 8, 9, 15, tzinfo=UTC)
+
+    # Statement built once and executed with bookmark_id parameter
+    _SELECT_BOOKMARK_TOPICS = sa.select(BookmarkTopic).where(BookmarkTopic.bookmark_id == sa.bindparam('bookmark_id'))
 
     def _select_bookmark_topics(self, bookmark_id):
         """Retrieve specified bookmark topics from db; return empty list if None exist."""
-        return self.session.query(BookmarkTopic).filter_by(bookmark_id=bookmark_id).all()
+        return self.session.execute(self._SELECT_BOOKMARK_TOPICS, {'bookmark_id': bookmark_id}).scalars().all()
+
+    def _new_bookmark_topic(self):
+        """Return new BookmarkTopic of test bookmark."""
+        return BookmarkTopic(bookmark_id=self._bookmark_id,
+                             topic=self._topic,
+                             created_on=self._created_on)
 
     def test_bookmark_topic(self):
         """Verify BookmarkTopic creation."""
-        # Create and save bookmark first because of FK relationship
-        test_bookmark = self._create_test_bookmark()
-        bookmark_topic = BookmarkTopic(bookmark_id=self._bookmark_id,
-                                       topic=self._topic,
-                                       created_on=self._created_on)
-        self.session.merge(bookmark_topic)
-        self.session.flush()
+        self.session.add(self._new_bookmark_topic())
         
         topics = self._select_bookmark_topics(self._bookmark_id)
         self.assertEqual(1, len(topics))
@@ -778,11 +966,8 @@ class BookmarkTopicTests(BookmarkDaoTestCase):
 
     def test_bookmark_topic__association_proxy(self):
         """Verify BookmarkTopic creation via Bookmark.topic_names."""
-        # Create and save bookmark first because of FK relationship
-        test_bookmark = self._create_test_bookmark()
+        test_bookmark = self._select_bookmark(self._bookmark_id)
         test_bookmark.topic_names = [self._topic]
-        self.session.merge(test_bookmark)
-        self.session.flush()
         
         topics = self._select_bookmark_topics(self._bookmark_id)
         self.assertEqual(1, len(topics))
@@ -791,35 +976,22 @@ class BookmarkTopicTests(BookmarkDaoTestCase):
 
     def test_bookmark_topic__delete_leaves_bookmark(self):
         """Verify BookmarkTopic deletion leaves parent Bookmark intact."""
-        # Create and save bookmark first because of FK relationship
-        test_bookmark = self._create_test_bookmark()
-        bookmark_topic = BookmarkTopic(bookmark_id=self._bookmark_id,
-                                       topic=self._topic,
-                                       created_on=self._created_on)
-        self.session.merge(bookmark_topic)
-        self.session.flush()
+        self.session.add(self._new_bookmark_topic())
 
-        self.session.query(BookmarkTopic).filter_by(bookmark_id=self._bookmark_id).delete()
-        self.session.flush()
-        self.assertEqual([], self._select_bookmark_topics(self._bookmark_id))
+        self.session.query(BookmarkTopic).filter_by(bookmark_id=self._bookmark_id).delete(synchronize_session=False)
+        self.assertFalse(self._exists(BookmarkTopic, bookmark_id=self._bookmark_id))
         self.assertIsNotNone(self._select_bookmark(self._bookmark_id))
 
     def test_bookmark_relation__retrieval(self):
         """Verify that retrieving bookmark retrieves topics."""
-        # Create and save bookmark first because of FK relationship
-        test_bookmark = self._create_test_bookmark()
-        bookmark_topic = BookmarkTopic(bookmark_id=self._bookmark_id,
-                                       topic=self._topic,
-                                       created_on=self._created_on)
-        self.session.merge(bookmark_topic)
-        self.session.flush()
+        self.session.add(self._new_bookmark_topic())
         
         bookmark = self._select_bookmark(self._bookmark_id)
         self.assertEqual(1, len(bookmark.topics))
         self.assertEqual(self._topic, bookmark.topics[0].topic)
 
     def test_bookmark_relation__save(self):
-        # Create and save bookmark first because of FK relationship
+        """Verify that bookmark topic is saved along with bookmark."""
         bookmark_topic = BookmarkTopic(topic=self._topic,
                                        created_on=self._created_on)
         bookmark = Bookmark(
@@ -829,8 +1001,9 @@ class BookmarkTopicTests(BookmarkDaoTestCase):
             topics=[bookmark_topic])
 
         saved_bookmark = self._save_bookmark(bookmark)
-        self.session.flush()
 
+        # Read bookmark back from db rather than from the identity map
+        self.session.expunge_all()
         bookmark = self._select_bookmark(saved_bookmark.bookmark_id)
         self.assertIsNotNone(bookmark)
         self.assertEqual(1, len(bookmark.topics))
@@ -840,80 +1013,75 @@ class BookmarkTopicTests(BookmarkDaoTestCase):
 class BookmarkNoteTests(BookmarkDaoTestCase):
     """Verify BookmarkNote ORM."""
 
-    def setUp(self):
-        super(BookmarkNoteTests, self).setUp()
-        self._node_id = uuid.uuid4()
-        self._text = 'It was a dark and stormy night'
-        self._author = 'me, myself and i'
-        self._created_on = datetime.utcnow().replace(tzinfo=pytz.utc)
+    _SEED_TEST_BOOKMARK = True
+
+    _text = 'It was a dark and stormy night'
+    _author = 'me, myself and i'
+    _created_on = datetime(2017, 2, 8, 9, 15, tzinfo=UTC)
+
+    # Statement built once and executed with bookmark_id parameter
+    _SELECT_BOOKMARK_NOTES = sa.select(BookmarkNote).where(BookmarkNote.bookmark_id == sa.bindparam('bookmark_id'))
 
     def _select_bookmark_notes(self, bookmark_id):
         """Retrieve specified bookmark notes from db; return empty list if None exist."""
-        return self.session.query(BookmarkNote).filter_by(bookmark_id=bookmark_id).all()
+        return self.session.execute(self._SELECT_BOOKMARK_NOTES, {'bookmark_id': bookmark_id}).scalars().all()
+
+    def _new_bookmark_note(self, **kwargs):
+        """Return new BookmarkNote of test bookmark; kwargs are BookmarkNote attributes to add."""
+        return BookmarkNote(bookmark_id=self._bookmark_id,
+                            text=self._text,
+                            author=self._author,
+                            created_on=self._created_on,
+                            **kwargs)
+
+    def _verify_saved_bookmark_note(self, attrs, expected_note_id):
+        """Save BookmarkNote created with attrs and verify that it is retrieved intact.
+
+        The note is saved within its own savepoint, which is rolled back afterwards, and read back from
+        db rather than from the session's identity map.
+
+        :param attrs: BookmarkNote attributes beyond those of _new_bookmark_note
+        :param expected_note_id: UUID expected to identify the note; None if it is to be assigned
+        """
+        savepoint = _connection.begin_nested()
+        try:
+            self.session.add(self._new_bookmark_note(**attrs))
+            self.session.flush()
+            self.session.expunge_all()
+
+            notes = self._select_bookmark_notes(self._bookmark_id)
+            self.assertEqual(1, len(notes))
+            self.assertTrue(isinstance(notes[0].note_id, uuid.UUID))
+            if expected_note_id:
+                self.assertEqual(expected_note_id, notes[0].note_id)
+            self.assertEqual(self._bookmark_id, notes[0].bookmark_id)
+            self.assertEqual(self._text, notes[0].text)
+            self.assertEqual(self._author, notes[0].author)
+            self.assertEqual(self._created_on, notes[0].created_on)
+        finally:
+            Session.remove()
+            savepoint.rollback()
 
     def test_bookmark_note(self):
-        """Verify BookmarkNote creation; verify that note_id is assigned."""
-        # Create and save bookmark first because of FK relationship
-        test_bookmark = self._create_test_bookmark()
-        bookmark_note = BookmarkNote(bookmark_id=self._bookmark_id,
-                                     text=self._text,
-                                     author=self._author,
-                                     created_on=self._created_on)
-        self.session.merge(bookmark_note)
-        self.session.flush()
-        
-        notes = self._select_bookmark_notes(self._bookmark_id)
-        self.assertEqual(1, len(notes))
-        self.assertIsNotNone(notes[0].note_id)
-        self.assertTrue(isinstance(notes[0].note_id, uuid.UUID))
-        self.assertEqual(self._bookmark_id, notes[0].bookmark_id)
-        self.assertEqual(self._text, notes[0].text)
-        self.assertEqual(self._author, notes[0].author)
-        self.assertEqual(self._created_on, notes[0].created_on)
-
-    def test_bookmark_note__specify_note_id(self):
-        """Verify BookmarkNote creation with specified note_id."""
-        # Create and save bookmark first because of FK relationship
-        test_bookmark = self._create_test_bookmark()
-        note_id = uuid.uuid4()
-        bookmark_note = BookmarkNote(note_id=note_id,
-                                     bookmark_id=self._bookmark_id,
-                                     text=self._text,
-                                     author=self._author,
-                                     created_on=self._created_on)
-        self.session.merge(bookmark_note)
-        self.session.flush()
-        
-        notes = self._select_bookmark_notes(self._bookmark_id)
-        self.assertEqual(1, len(notes))
-        self.assertEqual(note_id, notes[0].note_id)
+        """Verify BookmarkNote creation, both with note_id assigned and with specified note_id."""
+        note_id = uuid.UUID(int=102)
+        cases = [('assign_note_id', {}, None),
+                 ('specify_note_id', {'note_id': note_id}, note_id)]
+        for name, attrs, expected_note_id in cases:
+            with self.subTest(name=name):
+                self._verify_saved_bookmark_note(attrs, expected_note_id)
 
     def test_bookmark_note__delete_leaves_bookmark(self):
         """Verify BookmarkNote deletion leaves parent Bookmark intact."""
-        # Create and save bookmark first because of FK relationship
-        test_bookmark = self._create_test_bookmark()
-        bookmark_note = BookmarkNote(bookmark_id=self._bookmark_id,
-                                     text=self._text,
-                                     author=self._author,
-                                     created_on=self._created_on)
-        self.session.merge(bookmark_note)
-        self.session.flush()
+        self.session.add(self._new_bookmark_note())
 
-        self.session.query(BookmarkNote).filter_by(bookmark_id=self._bookmark_id).delete()
-        self.session.flush()
-        self.assertEqual([], self._select_bookmark_notes(self._bookmark_id))
+        self.session.query(BookmarkNote).filter_by(bookmark_id=self._bookmark_id).delete(synchronize_session=False)
+        self.assertFalse(self._exists(BookmarkNote, bookmark_id=self._bookmark_id))
         self.assertIsNotNone(self._select_bookmark(self._bookmark_id))
 
     def test_bookmark_relation__retrieval(self):
         """Verify that retrieving bookmark retrieves notes."""
-        # Create and save bookmark first because of FK relationship
-        test_bookmark = self._create_test_bookmark()
-        bookmark_note = BookmarkNote(bookmark_id=self._bookmark_id,
-                                     text=self._text,
-                                     author=self._author,
-                                     created_on=self._created_on)
-        self.session.merge(bookmark_note)
-        self.session.flush()
+        self.session.add(self._new_bookmark_note())
         
         bookmark = self._select_bookmark(self._bookmark_id)
         self.assertEqual(1, len(bookmark.notes))
@@ -931,8 +1099,9 @@ class BookmarkNoteTests(BookmarkDaoTestCase):
             notes=[bookmark_note])
 
         saved_bookmark = self._save_bookmark(bookmark)
-        self.session.flush()
 
+        # Read bookmark back from db rather than from the identity map
+        self.session.expunge_all()
         bookmark = self._select_bookmark(saved_bookmark.bookmark_id)
         self.assertIsNotNone(bookmark)
         self.assertEqual(1, len(bookmark.notes))
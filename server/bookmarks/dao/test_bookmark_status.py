@@ -3,85 +3,100 @@
 python -m unittest -v bookmarks.dao.test_bookmark_status
 """
 
+import re
 import unittest
 
 from .bookmark_status import BookmarkStatus
 
+# Valid statuses that a new bookmark may not have
+_NON_ORIGINAL_STATUSES = frozenset(BookmarkStatus.VALID_STATUSES).difference(BookmarkStatus.VALID_ORIGINAL_STATUSES)
+
+# Patterns of validation error messages, formatted with the escaped offending status
+_INVALID_STATUS_PATTERN = "Invalid.*{0}.*new.*submitted.*accepted.*rejected"
+_INVALID_ORIGINAL_STATUS_PATTERN = "Invalid.*{0}.*new.*submitted"
+
+# Every transition between valid statuses: (old status, new status, whether allowed)
+_TRANSITIONS = (
+    (BookmarkStatus.NEW, BookmarkStatus.NEW, True),
+    (BookmarkStatus.NEW, BookmarkStatus.SUBMITTED, True),
+    (BookmarkStatus.NEW, BookmarkStatus.ACCEPTED, True),
+    (BookmarkStatus.NEW, BookmarkStatus.REJECTED, True),
+    (BookmarkStatus.SUBMITTED, BookmarkStatus.NEW, False),
+    (BookmarkStatus.SUBMITTED, BookmarkStatus.SUBMITTED, True),
+    (BookmarkStatus.SUBMITTED, BookmarkStatus.ACCEPTED, True),
+    (BookmarkStatus.SUBMITTED, BookmarkStatus.REJECTED, True),
+    (BookmarkStatus.ACCEPTED, BookmarkStatus.NEW, False),
+    (BookmarkStatus.ACCEPTED, BookmarkStatus.SUBMITTED, True),
+    (BookmarkStatus.ACCEPTED, BookmarkStatus.ACCEPTED, True),
+    (BookmarkStatus.ACCEPTED, BookmarkStatus.REJECTED, True),
+    (BookmarkStatus.REJECTED, BookmarkStatus.NEW, False),
+    (BookmarkStatus.REJECTED, BookmarkStatus.SUBMITTED, True),
+    (BookmarkStatus.REJECTED, BookmarkStatus.ACCEPTED, True),
+    (BookmarkStatus.REJECTED, BookmarkStatus.REJECTED, True),
+)
+
 
 class BookmarkStatusTests(unittest.TestCase):
     def test_is_valid(self):
         """Verify that all VALID_STATUSES are in fact, valid."""
         for status in BookmarkStatus.VALID_STATUSES:
-            BookmarkStatus.assert_valid_status(status)
+            with self.subTest(status=status):
+                BookmarkStatus.assert_valid_status(status)
 
     def test_is_valid__case_sensitive(self):
         """Verify that all VALID_STATUSES are invalid if they are uppercased."""
         for status in BookmarkStatus.VALID_STATUSES:
-            self.assertRaisesRegex(ValueError,
-                                   "Invalid.*{0}.*new.*submitted.*accepted.*rejected".format(status.upper()),
-                                   BookmarkStatus.assert_valid_status,
-                                   status.upper())
+            with self.subTest(status=status):
+                self.assertRaisesRegex(ValueError,
+                                       _INVALID_STATUS_PATTERN.format(re.escape(status.upper())),
+                                       BookmarkStatus.assert_valid_status,
+                                       status.upper())
 
     def test_is_valid__invalid(self):
         """Verify that made-up statuses are not valid."""
         for status in ('free', 'to', 'be', 'you', 'and', 'me'):
-            self.assertRaisesRegex(ValueError,
-                                   "Invalid.*{0}.*new.*submitted.*accepted.*rejected".format(status),
-                                   BookmarkStatus.assert_valid_status,
-                                   status)
+            with self.subTest(status=status):
+                self.assertRaisesRegex(ValueError,
+                                       _INVALID_STATUS_PATTERN.format(re.escape(status)),
+                                       BookmarkStatus.assert_valid_status,
+                                       status)
 
     def test_is_valid_original_status(self):
         """Verify that 'new' and 'submitted' are valid original statuses."""
         for status in BookmarkStatus.VALID_ORIGINAL_STATUSES:
-            BookmarkStatus.assert_valid_original_status(status)
+            with self.subTest(status=status):
+                BookmarkStatus.assert_valid_original_status(status)
 
     def test_is_valid_original_status__invalid(self):
         """Verify that other strings, including other valid statuses, are not valid original statuses."""
-        test_statuses = set(BookmarkStatus.VALID_STATUSES).difference(
-            set(BookmarkStatus.VALID_ORIGINAL_STATUSES))
-        for status in ('every', 'giant', 'bird', 'dives', 'fast'):
-            test_statuses.add(status)
-
-        for status in test_statuses:
-            self.assertRaisesRegex(ValueError,
-                                   "Invalid.*{0}.*new.*submitted".format(status),
-                                   BookmarkStatus.assert_valid_original_status,
-                                   status)
-
-    def test_is_valid_status_transition__from_new(self):
-        """Verify that any transition out of 'new' is valid."""
-        for status in BookmarkStatus.VALID_STATUSES:
-            BookmarkStatus.assert_valid_status_transition(BookmarkStatus.NEW, status)
-
-    def test_is_valid_status_transition__to_new(self):
-        """Verify that any transition to 'new' is invalid."""
-        for status in BookmarkStatus.VALID_STATUSES:
-            if status == BookmarkStatus.NEW:
-                continue
-            self.assertRaisesRegex(ValueError,
-                                   "Invalid.*transition.*{0}.*new".format(status),
-                                   BookmarkStatus.assert_valid_status_transition,
-                                   status, BookmarkStatus.NEW)
-
-    def test_is_valid_status_transition__from_submitted(self):
-        """Verify that transition from submitted to accepted or rejected is valid."""
-        for status in (BookmarkStatus.ACCEPTED, BookmarkStatus.REJECTED):
-            BookmarkStatus.assert_valid_status_transition(BookmarkStatus.SUBMITTED, status)
-
-    def test_is_valid_status_transition__from_rejected(self):
-        """Verify that transition from rejected to submitted or accepted is valid."""
-        for status in (BookmarkStatus.ACCEPTED, BookmarkStatus.SUBMITTED):
-            BookmarkStatus.assert_valid_status_transition(BookmarkStatus.REJECTED, status)
-
-    def test_is_valid_status_transition__from_accepted(self):
-        """Verify that transition from accepted to submitted or rejected is valid."""
-        for status in (BookmarkStatus.REJECTED, BookmarkStatus.SUBMITTED):
-            BookmarkStatus.assert_valid_status_transition(BookmarkStatus.ACCEPTED, status)
+        for status in _NON_ORIGINAL_STATUSES.union(('every', 'giant', 'bird', 'dives', 'fast')):
+            with self.subTest(status=status):
+                self.assertRaisesRegex(ValueError,
+                                       _INVALID_ORIGINAL_STATUS_PATTERN.format(re.escape(status)),
+                                       BookmarkStatus.assert_valid_original_status,
+                                       status)
+
+    def test_is_valid_status_transition(self):
+        """Verify every transition between valid statuses: any status may follow 'new', and only 'new' may not."""
+        for old, new, allowed in _TRANSITIONS:
+            with self.subTest(old=old, new=new):
+                if allowed:
+                    BookmarkStatus.assert_valid_status_transition(old, new)
+                else:
+                    self.assertRaisesRegex(ValueError,
+                                           "Invalid.*transition.*{0}.*{1}".format(re.escape(old), re.escape(new)),
+                                           BookmarkStatus.assert_valid_status_transition,
+                                           old, new)
 
     def test_is_valid_status_transition__invalid_status(self):
         """Verify that if either status arg is invalid, is_valid_status_transition raises."""
         for old, new in [(BookmarkStatus.ACCEPTED, 'foo'), ('foo', BookmarkStatus.ACCEPTED)]:
-            self.assertRaisesRegex(ValueError,
-                                   "Invalid.*foo.*new.*submitted.*accepted.*rejected",
-                                   BookmarkStatus.assert_valid_status_transition,
-                                   old, new)
+            with self.subTest(old=old, new=new):
+                self.assertRaisesRegex(ValueError,
+                                       _INVALID_STATUS_PATTERN.format('foo'),
+                                       BookmarkStatus.assert_valid_status_transition,
+                                       old, new)
+
+    def test_allowed_transitions__complete(self):
+        """Verify that allowed transitions are defined for every valid status."""
+        self.assertEqual(set(BookmarkStatus.VALID_STATUSES), set(BookmarkStatus._ALLOWED_TRANSITIONS))
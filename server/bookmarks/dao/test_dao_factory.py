@@ -2,26 +2,37 @@
 
 
 from datetime import datetime
-import uuid
 
 from .bookmark_dao import Bookmark, BookmarkTopic, BookmarkNote
+from .uuid_type import UUIDType
+
+# Default for timestamp attributes; tests needing particular times specify them
+_TIMESTAMP = datetime(2017, 2, 22, 18, 30)
 
 
 class TestDaoFactory(object):
     
     @classmethod
-    def create_bookmark(cls, **kwargs) -> Bookmark:
-        """Return Bookmark object.
+    def bookmark_attrs(cls, **kwargs) -> dict:
+        """Return dict of Bookmark attributes, e.g. for bulk insert.
 
         **kwargs are Bookmark attributes, i.e. bookmark_id, url, etc.
         """
-        attrs = {'bookmark_id': uuid.uuid4(),
+        attrs = {'bookmark_id': UUIDType.random_uuid(),
                  'url': 'http://news/articles/article12.html',
                  'summary': 'Mr. Ed says the Pledge of Allegiance',
-                 'sort_date': datetime.utcnow(),
+                 'sort_date': _TIMESTAMP,
                  'display_date_format': '%Y.%m.%d'}
         attrs.update(**kwargs)
-        return Bookmark(**attrs)
+        return attrs
+
+    @classmethod
+    def create_bookmark(cls, **kwargs) -> Bookmark:
+        """Return Bookmark object.
+
+        **kwargs are Bookmark attributes, i.e. bookmark_id, url, etc.
+        """
+        return Bookmark(**cls.bookmark_attrs(**kwargs))
 
     @classmethod
     def create_bookmark_topic(cls, **kwargs) -> BookmarkTopic:
@@ -29,9 +40,9 @@ class TestDaoFactory(object):
         
         **kwargs are BookmarkTopic attributes; i.e. bookmark id, topic, and created_on.
         """
-        attrs = {'bookmark_id': uuid.uuid4(),
+        attrs = {'bookmark_id': UUIDType.random_uuid(),
                  'topic': 'Test Topic',
-                 'created_on': datetime.utcnow()}
+                 'created_on': _TIMESTAMP}
         attrs.update(**kwargs)
         return BookmarkTopic(**attrs)
 
@@ -41,10 +52,10 @@ class TestDaoFactory(object):
         
         **kwargs are BookmarkNote attributes; i.e. note_id, bookmark id, text, etc.
         """
-        attrs = {'note_id': uuid.uuid4(),
-                 'bookmark_id': uuid.uuid4(),
+        attrs = {'note_id': UUIDType.random_uuid(),
+                 'bookmark_id': UUIDType.random_uuid(),
                  'text': 'This is a test note.',
                  'author': 'Intrepid Volunteer',
-                 'created_on': datetime.utcnow()}
+                 'created_on': _TIMESTAMP}
         attrs.update(**kwargs)
         return BookmarkNote(**attrs)
@@ -29,6 +29,21 @@ class DateParserTests(unittest.TestCase):
     def test_parse_date__YMD_HM(self):
         self.assert_success('2017.03.23 06:28', '%Y.%m.%d %H:%M', datetime.datetime(2017, 3, 23, 6, 28))
 
+    def test_parse_date__unpadded(self):
+        self.assert_success('2017.3.2 6:8', '%Y.%m.%d %H:%M', datetime.datetime(2017, 3, 2, 6, 8))
+
     def test_parse_date_invalid(self):
         with self.assertRaises(DateParseError):
             DateParser.parse_date('blarg')
+
+    def test_parse_date_invalid__out_of_range(self):
+        for date_str in ('2017.13', '2017.02.30', '2017.02.28 24', '2017.02.28 23:60'):
+            with self.subTest(date_str=date_str):
+                with self.assertRaises(DateParseError):
+                    DateParser.parse_date(date_str)
+
+    def test_parse_date_invalid__partial(self):
+        for date_str in ('17', '2017.', '2017.02.28 ', '2017.02.28 23:', ' 2017'):
+            with self.subTest(date_str=date_str):
+                with self.assertRaises(DateParseError):
+                    DateParser.parse_date(date_str)
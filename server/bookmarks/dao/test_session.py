@@ -2,14 +2,19 @@
 Tests for Session.
 """
 
+import asyncio
+from contextlib import contextmanager
+import threading
 import unittest
 from unittest.mock import patch, Mock
 
+import sqlalchemy as sa
 import sqlalchemy.orm as sa_orm
 from sqlalchemy.sql import text
 
-from .session import Session
-from .settings import PRESTERITY_DB_URL
+from . import session
+from .session import Session, _create_engine, _resolve_scopefunc, init_local_db, session_scope
+from .settings import get_db_url
 
 
 class SessionTest(unittest.TestCase):
@@ -25,6 +30,49 @@ class SessionTest(unittest.TestCase):
         Session.initialize()
         self.assertIsNotNone(Session._session)
 
+    @patch('sqlalchemy.create_engine')
+    def test_initialize__concurrent(self, mock_create_engine):
+        """Verify that concurrent initialization creates only one engine."""
+        threads = [threading.Thread(target=Session.initialize) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        mock_create_engine.assert_called_once()
+        self.assertEqual(get_db_url(), mock_create_engine.call_args[0][0])
+
+    @patch('atexit.register')
+    @patch('sqlalchemy.create_engine')
+    def test_initialize__atexit(self, mock_create_engine, mock_atexit_register):
+        """Verify that initialization, even if repeated, registers no further exit handlers."""
+        Session.initialize()
+        Session._session = None
+        Session.initialize()
+        self.assertEqual(0, mock_atexit_register.call_count)
+
+    @patch('sqlalchemy.create_engine')
+    def test_create_engine(self, mock_create_engine):
+        """Verify that engine is configured for batched writes."""
+        _create_engine(get_db_url())
+        kwargs = mock_create_engine.call_args[1]
+        self.assertEqual('utf8', kwargs['client_encoding'])
+        self.assertEqual('values_plus_batch', kwargs['executemany_mode'])
+        self.assertIn('executemany_batch_page_size', kwargs)
+        self.assertIn('insertmanyvalues_page_size', kwargs)
+        self.assertTrue(kwargs['pool_pre_ping'])
+        self.assertIn('pool_recycle', kwargs)
+
+    @patch('sqlalchemy.create_engine')
+    def test_create_engine__sqlite(self, mock_create_engine):
+        """Verify that only dialect-independent options are passed for other databases, plus overrides."""
+        mock_poolclass = Mock(name='poolclass')
+        _create_engine(sa.engine.make_url('sqlite://'), poolclass=mock_poolclass)
+        kwargs = mock_create_engine.call_args[1]
+        self.assertIn('insertmanyvalues_page_size', kwargs)
+        self.assertEqual(mock_poolclass, kwargs['poolclass'])
+        for option in ('client_encoding', 'executemany_mode', 'connect_args'):
+            self.assertNotIn(option, kwargs)
+
     def test_get(self):
         """Verify that Session.get returns working session."""
         session = Session.get()
@@ -34,6 +82,29 @@ class SessionTest(unittest.TestCase):
         ping = session.connection().execute(text("SELECT 'ping' AS pong")).fetchone()['pong']
         self.assertEqual(ping, "ping")
 
+    def test_resolve_scopefunc(self):
+        """Verify that scope function distinguishes threads."""
+        scopefunc = _resolve_scopefunc()
+        scopes = []
+        thread = threading.Thread(target=lambda: scopes.append(scopefunc()))
+        thread.start()
+        thread.join()
+        self.assertNotEqual(scopefunc(), scopes[0])
+
+    def test_resolve_scopefunc__asyncio(self):
+        """Verify that scope function distinguishes asyncio tasks sharing a thread."""
+        scopefunc = _resolve_scopefunc()
+
+        async def task_scope():
+            return scopefunc()
+
+        async def gather_scopes():
+            return await asyncio.gather(task_scope(), task_scope())
+
+        scopes = asyncio.run(gather_scopes())
+        self.assertNotEqual(scopes[0], scopes[1])
+        self.assertNotIn(scopefunc(), scopes)
+
     @patch.object(Session, 'initialize')
     def test_get__initialize(self, mock_initialize):
         """Verify that Session.get initializes session iff necessary."""
@@ -46,6 +117,14 @@ class SessionTest(unittest.TestCase):
         Session.get()
         self.assertEqual(0, mock_initialize.call_count)
 
+    def test_get__initialized(self):
+        """Verify that Session.get does not take the initialization lock once session exists."""
+        mock_session = Mock(name='mock_session')
+        Session._session = mock_session
+        with patch.object(Session, '_init_lock') as mock_init_lock:
+            self.assertIs(mock_session, Session.get())
+        self.assertEqual(0, mock_init_lock.__enter__.call_count)
+
     def test_get__idempotent(self):
         """Verify that scoped session is the same each time Session.get is called."""
         session_1 = Session.get()
@@ -73,7 +152,125 @@ class SessionTest(unittest.TestCase):
         self.assertEqual(0, mock_session.commit.call_count)
 
     def test_close__no_session(self):
-        """Verify that calling close does no harm if no session exists, neither Session.initialize nor get was ever called."""
+        """Verify that calling close does no harm if no session exists.
+
+        Neither Session.initialize nor get was ever called.
+        """
         self.assertIsNone(Session._session)
         Session.close()
         self.assertIsNone(Session._session)
+
+    def test_remove(self):
+        """Verify that remove releases session back to connection pool without committing."""
+        mock_session = Mock(name='mock_session',
+                            commit=Mock(),
+                            remove=Mock())
+        Session._session = mock_session
+        Session.remove()
+        mock_session.remove.assert_called_once_with()
+        self.assertEqual(0, mock_session.commit.call_count)
+
+    def test_remove__no_session(self):
+        """Verify that calling remove does no harm if no session exists."""
+        self.assertIsNone(Session._session)
+        Session.remove()
+        self.assertIsNone(Session._session)
+
+
+class SessionScopeTest(unittest.TestCase):
+    """Tests for session_scope."""
+
+    def setUp(self):
+        """Install mock scoped session."""
+        self.mock_session = Mock(name='mock_session',
+                                 commit=Mock(),
+                                 rollback=Mock(),
+                                 remove=Mock())
+        Session._session = self.mock_session
+
+    def tearDown(self):
+        Session._session = None
+
+    def test_session_scope(self):
+        """Verify that session is committed and removed when block succeeds."""
+        with session_scope() as session:
+            self.assertIs(self.mock_session, session)
+        self.mock_session.commit.assert_called_once_with()
+        self.assertEqual(0, self.mock_session.rollback.call_count)
+        self.mock_session.remove.assert_called_once_with()
+
+    def test_session_scope__read_only(self):
+        """Verify that read-only session is removed without commit."""
+        with session_scope(read_only=True):
+            pass
+        self.assertEqual(0, self.mock_session.commit.call_count)
+        self.mock_session.remove.assert_called_once_with()
+
+    def test_session_scope__error(self):
+        """Verify that session is rolled back and removed when block raises."""
+        with self.assertRaises(ValueError):
+            with session_scope():
+                raise ValueError('oops')
+        self.assertEqual(0, self.mock_session.commit.call_count)
+        self.mock_session.rollback.assert_called_once_with()
+        self.mock_session.remove.assert_called_once_with()
+
+
+class InitLocalDbTest(unittest.TestCase):
+    """Tests for init_local_db."""
+
+    def setUp(self):
+        init_local_db.already_init = False
+        self.mock_cursor = Mock(name='mock_cursor')
+        self.dbnames = []
+        cursor_patcher = patch.object(session, '_local_db_cursor', side_effect=self._local_db_cursor)
+        cursor_patcher.start()
+        self.addCleanup(cursor_patcher.stop)
+
+    def tearDown(self):
+        init_local_db.already_init = False
+
+    @contextmanager
+    def _local_db_cursor(self, dbname='postgres'):
+        self.dbnames.append(dbname)
+        yield self.mock_cursor
+
+    def _executed_statements(self):
+        return [call[0][0] for call in self.mock_cursor.execute.call_args_list
+                if not call[0][0].startswith('SELECT')]
+
+    @patch.object(session, 'check_call')
+    def test_init_local_db__already_init(self, mock_check_call):
+        """Verify that init_local_db does nothing once it has succeeded."""
+        init_local_db.already_init = True
+        init_local_db()
+        self.assertEqual([], self.dbnames)
+        self.assertEqual(0, mock_check_call.call_count)
+
+    @patch.object(session, 'check_call')
+    def test_init_local_db__existing(self, mock_check_call):
+        """Verify that existing database and user are not recreated."""
+        self.mock_cursor.fetchone.return_value = (1,)
+        init_local_db()
+
+        self.assertEqual(['postgres', 'presterity'], self.dbnames)
+        self.assertEqual(['CREATE SCHEMA IF NOT EXISTS apps', 'GRANT ALL ON SCHEMA apps TO app_user'],
+                         self._executed_statements())
+        # Only the migrations are run in a subprocess
+        self.assertEqual(1, mock_check_call.call_count)
+        self.assertTrue(init_local_db.already_init)
+
+    @patch.object(session, 'check_call')
+    def test_init_local_db__new(self, mock_check_call):
+        """Verify that database, schema and user are created without spawning psql."""
+        self.mock_cursor.fetchone.return_value = None
+        init_local_db()
+
+        statements = self._executed_statements()
+        for statement in ('CREATE DATABASE presterity', 'CREATE USER app_user WITH PASSWORD %s',
+                          'ALTER ROLE app_user SET search_path TO apps', 'CREATE SCHEMA IF NOT EXISTS apps',
+                          'GRANT ALL ON SCHEMA apps TO app_user'):
+            self.assertIn(statement, statements)
+        self.mock_cursor.execute.assert_any_call('CREATE USER app_user WITH PASSWORD %s', ('resist',))
+        self.assertEqual(1, mock_check_call.call_count)
+        self.assertIn('mschematool', mock_check_call.call_args[0][0])
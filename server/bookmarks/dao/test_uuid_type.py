@@ -0,0 +1,101 @@
+"""Tests for UUIDType.
+
+python -m unittest -v bookmarks.dao.test_uuid_type
+"""
+
+import os
+import select
+import signal
+import unittest
+from unittest.mock import patch
+import uuid
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+from . import uuid_type
+from .uuid_type import UUIDType
+
+
+class UUIDTypeTests(unittest.TestCase):
+
+    def setUp(self):
+        self.uuid_type = UUIDType()
+        self.dialect = sqlite.dialect()
+
+    def test_round_trip(self):
+        """Verify that UUID read back is equal to, and behaves like, UUID stored."""
+        for value in (uuid.uuid4(), uuid.UUID(int=1), uuid.UUID(int=2 ** 128 - 1)):
+            with self.subTest(value=value):
+                stored = self.uuid_type.process_bind_param(value, self.dialect)
+                self.assertEqual(str(value), stored)
+                result = self.uuid_type.process_result_value(stored, self.dialect)
+                self.assertEqual(value, result)
+                self.assertEqual(hash(value), hash(result))
+                self.assertEqual(str(value), str(result))
+                self.assertEqual(value.version, result.version)
+
+    def test_round_trip__new_uuid(self):
+        """Verify that default values, which are strings, are read back as equal UUIDs."""
+        value = UUIDType.new_uuid()
+        stored = self.uuid_type.process_bind_param(value, self.dialect)
+        self.assertEqual(uuid.UUID(value), self.uuid_type.process_result_value(stored, self.dialect))
+
+    def test_random_uuid(self):
+        """Verify that random UUIDs are distinct version 4 UUIDs, including across random byte batches."""
+        values = [UUIDType.random_uuid() for _ in range(2 * uuid_type._RANDOM_BATCH_SIZE // 16 + 1)]
+        self.assertEqual(len(values), len(set(values)))
+        for value in values:
+            self.assertEqual(4, value.version)
+            self.assertEqual(uuid.RFC_4122, value.variant)
+
+    def test_random_uuid__batched(self):
+        """Verify that random bytes are drawn once per batch, and drawn afresh once discarded, as in forked child."""
+        with patch.object(uuid_type.os, 'urandom', wraps=os.urandom) as mock_urandom:
+            uuid_type._reset_random_bytes()
+            UUIDType.random_uuid()
+            UUIDType.random_uuid()
+            mock_urandom.assert_called_once_with(uuid_type._RANDOM_BATCH_SIZE)
+            uuid_type._reset_random_bytes()
+            UUIDType.random_uuid()
+            self.assertEqual(2, mock_urandom.call_count)
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'requires os.fork')
+    def test_random_uuid__fork_with_lock_held(self):
+        """Verify that forked child can draw UUIDs, distinct from parent's, while lock is held in parent at fork."""
+        parent_uuid = UUIDType.random_uuid()
+        read_fd, write_fd = os.pipe()
+        with uuid_type._random_lock:
+            pid = os.fork()
+            if pid == 0:
+                # Child: report UUID drawn, or nothing if that fails, and exit without running test cleanup
+                try:
+                    os.close(read_fd)
+                    os.write(write_fd, UUIDType.random_uuid().bytes)
+                finally:
+                    os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd, 'rb') as child_output:
+            # A child deadlocked on the inherited lock never writes; kill it rather than hang the test run
+            if not select.select([child_output], [], [], 10)[0]:
+                os.kill(pid, signal.SIGKILL)
+            child_bytes = child_output.read()
+        os.waitpid(pid, 0)
+        self.assertEqual(16, len(child_bytes))
+        child_uuid = uuid.UUID(bytes=child_bytes)
+        self.assertEqual(4, child_uuid.version)
+        self.assertNotEqual(parent_uuid, child_uuid)
+        self.assertNotEqual(UUIDType.random_uuid(), child_uuid)
+
+    def test_none(self):
+        """Verify that NULL is passed through in both directions."""
+        self.assertIsNone(self.uuid_type.process_bind_param(None, self.dialect))
+        self.assertIsNone(self.uuid_type.process_result_value(None, self.dialect))
+
+    def test_postgresql(self):
+        """Verify that native uuid type is used on PostgreSQL, with UUIDs passed through in both directions."""
+        dialect = postgresql.dialect()
+        self.assertIsInstance(self.uuid_type.load_dialect_impl(dialect), postgresql.UUID)
+        value = uuid.uuid4()
+        self.assertIs(value, self.uuid_type.process_bind_param(value, dialect))
+        self.assertEqual(value, self.uuid_type.process_bind_param(str(value), dialect))
+        self.assertIs(value, self.uuid_type.process_result_value(value, dialect))
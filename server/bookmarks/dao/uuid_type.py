@@ -1,29 +1,96 @@
 """Custom UUID type.
 """
 
+import os
+import threading
 import uuid
 
+from sqlalchemy.dialects import postgresql
 import sqlalchemy.types as sa_types
 
 __all__ = ('UUIDType',)
 
+_new_uuid_object = uuid.UUID.__new__
+_set_uuid_attr = object.__setattr__
+
+# Random bytes are drawn from the OS in batches of this size and handed out 16 at a time
+_RANDOM_BATCH_SIZE = 16 * 1024
+
+_random_lock = threading.Lock()
+_random_bytes = b''
+_random_offset = 0
+
+
+def _reset_random_bytes():
+    """Discard undrawn random bytes; a forked child must not hand out the same UUIDs as its parent."""
+    global _random_bytes, _random_offset
+    _random_bytes = b''
+    _random_offset = 0
+
+
+def _after_fork_in_child():
+    """Discard undrawn random bytes and re-create lock, which may have been held by another thread at fork."""
+    global _random_lock
+    _random_lock = threading.Lock()
+    _reset_random_bytes()
+
+
+os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def _next_random_bytes():
+    """Return 16 random bytes, drawing a new batch from os.urandom when the current one is used up."""
+    global _random_bytes, _random_offset
+    with _random_lock:
+        if _random_offset + 16 > len(_random_bytes):
+            _random_bytes = os.urandom(_RANDOM_BATCH_SIZE)
+            _random_offset = 0
+        offset = _random_offset
+        _random_offset += 16
+        return _random_bytes[offset:offset + 16]
+
 
 class UUIDType(sa_types.TypeDecorator):
     """http://docs.sqlalchemy.org/en/latest/core/custom_types.html#backend-agnostic-guid-type
+
+    On PostgreSQL, UUIDs are stored in the native 16-byte uuid type; elsewhere, as CHAR(36) in
+    8-4-4-4-12 form.
     """
     impl = sa_types.CHAR
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == 'postgresql':
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=True))
+        return dialect.type_descriptor(sa_types.CHAR(36))
 
     def process_bind_param(self, value, dialect):
         if value:
-            value = str(value)
+            if dialect.name == 'postgresql':
+                if not isinstance(value, uuid.UUID):
+                    value = uuid.UUID(value)
+            else:
+                value = str(value)
         return value
 
     def process_result_value(self, value, dialect):
-        if value:
-            value = uuid.UUID(hex=value)
+        """Convert stored UUID string to UUID; native PostgreSQL UUIDs are already converted by the driver.
+
+        Runs for every UUID in every row fetched, so rather than uuid.UUID(hex=...), which validates and
+        normalizes its argument, builds the UUID directly from the string this type wrote.
+        """
+        if value and not isinstance(value, uuid.UUID):
+            result = _new_uuid_object(uuid.UUID)
+            _set_uuid_attr(result, 'int', int(value.replace('-', ''), 16))
+            _set_uuid_attr(result, 'is_safe', uuid.SafeUUID.unknown)
+            value = result
         return value
 
     @staticmethod
-    def new_uuid():
-        return str(uuid.uuid4())
+    def random_uuid() -> uuid.UUID:
+        """Return random (version 4) UUID, like uuid.uuid4 but without a system call per UUID."""
+        return uuid.UUID(bytes=_next_random_bytes(), version=4)
 
+    @classmethod
+    def new_uuid(cls) -> str:
+        return str(cls.random_uuid())
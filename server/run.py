@@ -7,10 +7,22 @@
 from __future__ import unicode_literals
 
 import argparse
+import atexit
 import logging
 import logging.handlers
+import os
+import queue
+
+import sqlalchemy.exc as sa_exc
 
 from bookmarks.api import app
+import bookmarks.dao as dao
+
+# Size at which bookmarks.log is rotated
+LOG_FILE_MAX_BYTES = 50 * 1024 * 1024
+
+log = logging.getLogger(__name__)
+
 
 def parse_args():
     parser = argparse.ArgumentParser(
@@ -27,16 +39,40 @@ def setup_logging(level=logging.INFO):
     # Set basic log level
     app.logger.setLevel(level)
 
-    # Log to file
+    # Log to file from a background thread, so request threads only enqueue records
     formatter = logging.Formatter("[%(asctime)s] {%(pathname)s:%(lineno)d} %(levelname)s - %(message)s")
-    handler = logging.handlers.RotatingFileHandler('bookmarks.log', backupCount=23)
+    file_handler = logging.handlers.RotatingFileHandler('bookmarks.log', maxBytes=LOG_FILE_MAX_BYTES,
+                                                        backupCount=23)
+    file_handler.setLevel(level)
+    file_handler.setFormatter(formatter)
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    handler = logging.handlers.QueueHandler(log_queue)
     handler.setLevel(level)
-    handler.setFormatter(formatter)
-    app.logger.addHandler(handler)
 
-    # Configure application logs
-    logging.getLogger(__name__).setLevel(level)
-    logging.getLogger(__name__).addHandler(handler)
+    # Configure application logs, including module loggers under the bookmarks package. The app
+    # logger is bookmarks.api, so it propagates to the bookmarks handler rather than having its own.
+    for logger_name in (__name__, 'bookmarks'):
+        logging.getLogger(logger_name).setLevel(level)
+        logging.getLogger(logger_name).addHandler(handler)
+
+
+def warm_db(debug=False):
+    """Create database engine and open one pooled connection, so the first request pays for neither.
+
+    With debug, the reloader serves requests from a child process; the parent, which only watches
+    for changes, does not connect. If the database cannot be reached, log a warning and carry on;
+    requests will connect once it is available.
+    """
+    if debug and os.environ.get('WERKZEUG_RUN_MAIN') != 'true':
+        return
+    try:
+        with dao.session_scope(read_only=True) as session:
+            session.connection()
+    except sa_exc.DBAPIError as db_error:
+        log.warning("Could not connect to db on startup: %s", db_error)
 
 
 if __name__ == "__main__":
@@ -45,5 +81,6 @@ if __name__ == "__main__":
     if args.verbose:
         log_level = logging.DEBUG
     setup_logging(level=log_level)
+    warm_db(debug=args.verbose)
     port = int(args.port)
     app.run(host='localhost', port=port, debug=args.verbose)
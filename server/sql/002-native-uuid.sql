@@ -0,0 +1,15 @@
+/* Store bookmark and note ids in the native 16-byte uuid type rather than CHAR(36) */
+
+-- Foreign keys must be dropped while referencing and referenced columns change type
+ALTER TABLE apps.bookmark_topics DROP CONSTRAINT bookmark_topics_bookmark_id_fkey;
+ALTER TABLE apps.bookmark_notes DROP CONSTRAINT bookmark_notes_bookmark_id_fkey;
+
+ALTER TABLE apps.bookmarks ALTER COLUMN bookmark_id TYPE UUID USING bookmark_id::uuid;
+ALTER TABLE apps.bookmark_topics ALTER COLUMN bookmark_id TYPE UUID USING bookmark_id::uuid;
+ALTER TABLE apps.bookmark_notes ALTER COLUMN note_id TYPE UUID USING note_id::uuid;
+ALTER TABLE apps.bookmark_notes ALTER COLUMN bookmark_id TYPE UUID USING bookmark_id::uuid;
+
+ALTER TABLE apps.bookmark_topics ADD CONSTRAINT bookmark_topics_bookmark_id_fkey
+  FOREIGN KEY (bookmark_id) REFERENCES apps.bookmarks ON DELETE CASCADE;
+ALTER TABLE apps.bookmark_notes ADD CONSTRAINT bookmark_notes_bookmark_id_fkey
+  FOREIGN KEY (bookmark_id) REFERENCES apps.bookmarks ON DELETE CASCADE;